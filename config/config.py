@@ -57,6 +57,13 @@ LOGGING_CONFIG = {
     "file": PROJECT_ROOT / "logs" / "project.log"
 }
 
-# Create directories if they don't exist
-for directory in [DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, EXTERNAL_DATA_DIR, MODELS_DIR]:
-    directory.mkdir(parents=True, exist_ok=True)
+# Create directories if they don't exist (a single stat() per directory once
+# they are in place; mkdir is only issued for directories that are missing)
+def ensure_directories(*directories):
+    """Create the given directories, skipping existing ones."""
+    for directory in directories:
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
+
+if __name__ == "__main__" or os.environ.get("STOREDGE_ENSURE_DIRS", "1") != "0":
+    ensure_directories(DATA_DIR, RAW_DATA_DIR, PROCESSED_DATA_DIR, EXTERNAL_DATA_DIR, MODELS_DIR)
@@ -7,131 +7,144 @@ This script creates sample CSV files to demonstrate the analyzer functionality.
 import pandas as pd
 import numpy as np
 from pathlib import Path
-import random
 
-def create_sample_units_data(num_units: int = 100) -> pd.DataFrame:
+# Lock choice tables for create_sample_locks_data, built once at import
+OVERLOCK_AUCTION = np.array(('Assigned Overlock', 'Assigned Auction'))
+VACANT_MISCOMPARE_LOCKS = np.array(('Tenant Using Lock', 'Assigned Overlock'))
+OCCUPIED_MISCOMPARE_LOCKS = np.array(('Assigned Vacant', 'Assigned Overlock'))
+LOCK_TYPES = np.array(('Standard', 'High Security', 'Electronic'))
+
+def create_sample_units_data(num_units: int = 100, rng: np.random.Generator = None) -> pd.DataFrame:
     """Create sample units.csv data."""
+    rng = rng if rng is not None else np.random.default_rng()
     
-    # Generate unit numbers (mix of different formats)
-    units = []
-    for i in range(1, num_units + 1):
-        if i <= 30:
-            units.append(f"A{i:03d}")  # A001, A002, etc.
-        elif i <= 60:
-            units.append(f"B{i-30:03d}")  # B001, B002, etc.
-        else:
-            units.append(f"C{i-60:03d}")  # C001, C002, etc.
+    # Generate unit numbers (mix of different formats): A001-A030, B001-B030, C001...
+    idx = np.arange(num_units)
+    prefixes = np.where(idx < 30, 'A', np.where(idx < 60, 'B', 'C'))
+    nums = np.where(idx < 30, idx + 1, np.where(idx < 60, idx - 29, idx - 59))
+    units = np.char.add(prefixes, np.char.zfill(nums.astype('U3'), 3))
     
     # Generate statuses (70% occupied, 30% vacant)
-    statuses = []
-    for i in range(num_units):
-        if random.random() < 0.7:  # 70% occupied
-            occupied_types = [
-                "Occupied - Tenant Active",
-                "Occupied - Month to Month",
-                "Occupied - Annual Lease",
-                "Occupied - Commercial Tenant"
-            ]
-            statuses.append(random.choice(occupied_types))
-        else:  # 30% vacant
-            vacant_types = [
-                "Vacant - Ready for Rent",
-                "Vacant - Needs Cleaning",
-                "Vacant - Under Maintenance",
-                "Vacant - Reserved"
-            ]
-            statuses.append(random.choice(vacant_types))
+    occupied_types = np.array([
+        "Occupied - Tenant Active",
+        "Occupied - Month to Month",
+        "Occupied - Annual Lease",
+        "Occupied - Commercial Tenant"
+    ])
+    vacant_types = np.array([
+        "Vacant - Ready for Rent",
+        "Vacant - Needs Cleaning",
+        "Vacant - Under Maintenance",
+        "Vacant - Reserved"
+    ])
+    mask = rng.random(num_units) < 0.7
+    statuses = np.where(mask,
+                        occupied_types[rng.integers(0, 4, num_units)],
+                        vacant_types[rng.integers(0, 4, num_units)])
     
     # Create DataFrame
     df = pd.DataFrame({
         'Unit': units,
         'Status': statuses,
-        'Size': np.random.choice(['5x5', '5x10', '10x10', '10x15', '10x20'], num_units),
-        'Floor': np.random.choice(['Ground', 'Second', 'Third'], num_units),
-        'Type': np.random.choice(['Standard', 'Climate', 'Drive-Up'], num_units),
-        'Rate': np.random.uniform(50, 300, num_units).round(2)
+        'Status_Kind': pd.Categorical(np.where(mask, 'Occupied', 'Vacant'),
+                                      categories=['Vacant', 'Occupied']),
+        'Size': rng.choice(['5x5', '5x10', '10x10', '10x15', '10x20'], num_units),
+        'Floor': rng.choice(['Ground', 'Second', 'Third'], num_units),
+        'Type': rng.choice(['Standard', 'Climate', 'Drive-Up'], num_units),
+        'Rate': rng.uniform(50, 300, num_units).round(2)
     })
     
     return df
 
-def create_sample_rentroll_data(units_df: pd.DataFrame) -> pd.DataFrame:
+def _status_kind(units_df: pd.DataFrame) -> pd.Series:
+    """
+    Return the Vacant/Occupied kind of each unit.
+    
+    Uses the Status_Kind column from create_sample_units_data when present;
+    otherwise derives it from the Status prefix (other statuses are NaN).
+    """
+    if 'Status_Kind' in units_df.columns:
+        return units_df['Status_Kind']
+    status = units_df['Status'].astype(str)
+    kind = np.where(status.str.startswith('Occupied'), 'Occupied',
+                    np.where(status.str.startswith('Vacant'), 'Vacant', None))
+    return pd.Series(pd.Categorical(kind, categories=['Vacant', 'Occupied']), index=units_df.index)
+
+def create_sample_rentroll_data(units_df: pd.DataFrame, rng: np.random.Generator = None) -> pd.DataFrame:
     """Create sample rentroll.csv data based on units data."""
+    rng = rng if rng is not None else np.random.default_rng()
     
-    # Only include occupied units
-    occupied_units = units_df[units_df['Status'].str.startswith('Occupied')].copy()
+    # Only include occupied units (pull just the columns needed)
+    mask = (_status_kind(units_df) == 'Occupied').to_numpy()
+    occ_units = units_df['Unit'].to_numpy()[mask]
+    rates = units_df['Rate'].to_numpy()[mask]
+    n = occ_units.size
     
     # Generate payment status (80% current, 20% delinquent)
-    payment_status = []
-    days_past_due = []
+    is_current = rng.random(n) < 0.8
+    payment_status = np.where(is_current, 'Current', 'Delinquent')
+    days_past_due = np.where(is_current, 0, rng.integers(1, 91, n))
     
-    for i in range(len(occupied_units)):
-        if random.random() < 0.8:  # 80% current
-            payment_status.append('Current')
-            days_past_due.append(0)
-        else:  # 20% delinquent
-            payment_status.append('Delinquent')
-            days_past_due.append(random.randint(1, 90))
+    idx_str = np.arange(1, n + 1).astype(str)
     
     # Create DataFrame
     df = pd.DataFrame({
-        'Unit': occupied_units['Unit'].values,
-        'Tenant_Name': [f"Tenant_{i+1}" for i in range(len(occupied_units))],
-        'Email': [f"tenant{i+1}@email.com" for i in range(len(occupied_units))],
-        'Phone': [f"555-{random.randint(1000, 9999)}" for _ in range(len(occupied_units))],
-        'Move_In_Date': pd.date_range('2020-01-01', periods=len(occupied_units), freq='D').strftime('%Y-%m-%d'),
-        'Monthly_Rate': occupied_units['Rate'].values,
-        'Last_Payment_Date': pd.date_range('2024-01-01', periods=len(occupied_units), freq='D').strftime('%Y-%m-%d'),
+        'Unit': occ_units,
+        'Tenant_Name': np.char.add('Tenant_', idx_str),
+        'Email': np.char.add(np.char.add('tenant', idx_str), '@email.com'),
+        'Phone': np.char.add('555-', rng.integers(1000, 10000, n).astype('U4')),
+        'Move_In_Date': (np.datetime64('2020-01-01') + np.arange(n)).astype(str),
+        'Monthly_Rate': rates,
+        'Last_Payment_Date': (np.datetime64('2024-01-01') + np.arange(n)).astype(str),
         'Payment_Status': payment_status,
         'Days Past Due': days_past_due,
-        'Balance': [max(0, days * rate / 30) for days, rate in zip(days_past_due, occupied_units['Rate'])],
-        'Auto_Pay': np.random.choice(['Yes', 'No'], len(occupied_units)),
-        'Insurance': np.random.choice(['Required', 'Waived'], len(occupied_units)),
-        'Notes': [''] * len(occupied_units)
+        'Balance': np.maximum(0, days_past_due * rates / 30),
+        'Auto_Pay': rng.choice(['Yes', 'No'], n),
+        'Insurance': rng.choice(['Required', 'Waived'], n),
+        'Notes': ''
     })
     
     return df
 
-def create_sample_locks_data(units_df: pd.DataFrame) -> pd.DataFrame:
+def create_sample_locks_data(units_df: pd.DataFrame, rng: np.random.Generator = None) -> pd.DataFrame:
     """Create sample locks.csv data based on units data."""
+    rng = rng if rng is not None else np.random.default_rng()
+    
+    n = len(units_df)
+    units = units_df['Unit'].to_numpy().astype(str)
+    status_kind = _status_kind(units_df)
+    is_vacant = (status_kind == 'Vacant').to_numpy()
+    is_occ = (status_kind == 'Occupied').to_numpy()
+    
+    r1 = rng.random(n)
+    r2 = rng.random(n)
+    choice_idx = rng.integers(0, 2, n)
+    
+    # Determine lock status based on unit status; for demo purposes 20% of
+    # occupied units are treated as delinquent
+    lock_status = np.select(
+        [is_vacant, is_occ & (r1 < 0.2), is_occ],
+        [np.array('Assigned Vacant'), OVERLOCK_AUCTION[choice_idx], np.array('Tenant Using Lock')],
+        default='Assigned Vacant'
+    )
+    
+    # Add some intentional miscompares for demonstration (10% miscompare rate)
+    miscompare = r2 < 0.1
+    lock_status = np.where(miscompare & is_vacant, VACANT_MISCOMPARE_LOCKS[choice_idx], lock_status)
+    lock_status = np.where(miscompare & is_occ, OCCUPIED_MISCOMPARE_LOCKS[choice_idx], lock_status)
+    
+    lock_ids = np.char.add(np.char.add(np.char.add('LOCK_', units), '_'),
+                           rng.integers(1000, 10000, n).astype('U4'))
     
-    # Generate lock assignments for all units
-    lock_data = []
-    
-    for _, unit_row in units_df.iterrows():
-        unit = unit_row['Unit']
-        status = unit_row['Status']
-        
-        # Determine lock status based on unit status
-        if status.startswith('Vacant'):
-            lock_status = 'Assigned Vacant'
-        elif status.startswith('Occupied'):
-            # Check if this unit is in rentroll (delinquent)
-            # For demo purposes, we'll randomly assign some as delinquent
-            if random.random() < 0.2:  # 20% chance of being delinquent
-                lock_status = random.choice(['Assigned Overlock', 'Assigned Auction'])
-            else:
-                lock_status = 'Tenant Using Lock'
-        else:
-            lock_status = 'Assigned Vacant'
-        
-        # Add some intentional miscompares for demonstration
-        if random.random() < 0.1:  # 10% miscompare rate
-            if status.startswith('Vacant'):
-                lock_status = random.choice(['Tenant Using Lock', 'Assigned Overlock'])
-            elif status.startswith('Occupied'):
-                lock_status = random.choice(['Assigned Vacant', 'Assigned Overlock'])
-        
-        lock_data.append({
-            'Lock_ID': f"LOCK_{unit}_{random.randint(1000, 9999)}",
-            'Unit Number': unit,
-            'Lock_Type': random.choice(['Standard', 'High Security', 'Electronic']),
-            'Install_Date': pd.date_range('2020-01-01', periods=1, freq='D')[0].strftime('%Y-%m-%d'),
-            'Status': lock_status,
-            'Last_Service': pd.date_range('2023-01-01', periods=1, freq='D')[0].strftime('%Y-%m-%d'),
-            'Notes': ''
-        })
-    
-    df = pd.DataFrame(lock_data)
+    df = pd.DataFrame({
+        'Lock_ID': lock_ids,
+        'Unit Number': units,
+        'Lock_Type': LOCK_TYPES[rng.integers(0, len(LOCK_TYPES), n)],
+        'Install_Date': '2020-01-01',
+        'Status': lock_status,
+        'Last_Service': '2023-01-01',
+        'Notes': ''
+    })
     return df
 
 def main():
@@ -142,21 +155,21 @@ def main():
     sample_dir = Path("sample_data")
     sample_dir.mkdir(exist_ok=True)
     
-    # Set random seed for reproducible results
-    random.seed(42)
-    np.random.seed(42)
+    # Use a seeded generator for reproducible results
+    rng = np.random.default_rng(42)
     
     # Generate sample data
     print("Generating units.csv...")
-    units_df = create_sample_units_data(100)
-    units_df.to_csv(sample_dir / "units.csv", index=False)
+    units_df = create_sample_units_data(100, rng)
+    # Status_Kind only feeds the other generators; units.csv keeps its real columns
+    units_df.drop(columns='Status_Kind').to_csv(sample_dir / "units.csv", index=False)
     
     print("Generating rentroll.csv...")
-    rentroll_df = create_sample_rentroll_data(units_df)
+    rentroll_df = create_sample_rentroll_data(units_df, rng)
     rentroll_df.to_csv(sample_dir / "rentroll.csv", index=False)
     
     print("Generating locks.csv...")
-    locks_df = create_sample_locks_data(units_df)
+    locks_df = create_sample_locks_data(units_df, rng)
     locks_df.to_csv(sample_dir / "locks.csv", index=False)
     
     print(f"\nSample data files created in '{sample_dir}' directory:")
@@ -14,11 +14,13 @@ import argparse
 import sys
 import logging
 from pathlib import Path
-import pandas as pd
 
-# Import our custom modules
-from src.unit_status_analyzer import UnitStatusAnalyzer
-from src.enhanced_excel_exporter import EnhancedExcelExporter
+from src.utils.file_utils import find_missing_files
+
+# Text columns of complete_analysis_results.csv; reading them as str lets
+# pandas skip type inference (columns absent from an older file are ignored)
+RESULT_TEXT_COLUMNS = ('Unit', 'Unit_Status', 'Final_Status', 'Actual_Lock_Status',
+                       'Expected_Lock_Status', 'Miscompare_Severity')
 
 def setup_logging():
     """Set up logging configuration."""
@@ -35,11 +37,14 @@ def export_from_csv(input_csv: str, output_excel: str):
         input_csv (str): Path to existing analysis results CSV
         output_excel (str): Path to output Excel file
     """
+    from src.unit_status_analyzer import read_csv_fast
+    from src.enhanced_excel_exporter import EnhancedExcelExporter
+    
     logger = logging.getLogger(__name__)
     
     try:
         logger.info(f"Loading analysis results from {input_csv}")
-        df = pd.read_csv(input_csv)
+        df = read_csv_fast(input_csv, dtype=dict.fromkeys(RESULT_TEXT_COLUMNS, str))
         
         logger.info("Creating enhanced Excel report...")
         exporter = EnhancedExcelExporter()
@@ -63,6 +68,9 @@ def export_from_analysis(units_file: str, rentroll_file: str, locks_file: str, o
         locks_file (str): Path to locks.csv
         output_excel (str): Path to output Excel file
     """
+    from src.unit_status_analyzer import UnitStatusAnalyzer, SEVERITY_HIGH_VACANT
+    from src.enhanced_excel_exporter import EnhancedExcelExporter
+    
     logger = logging.getLogger(__name__)
     
     try:
@@ -79,7 +87,7 @@ def export_from_analysis(units_file: str, rentroll_file: str, locks_file: str, o
         print(f"\nAnalysis Summary:")
         print(f"   Total Units: {summary['total_units']}")
         print(f"   Miscompares: {summary['miscompare_count']} ({summary['miscompare_rate']:.1f}%)")
-        print(f"   High Severity: {summary['severity_breakdown'].get('HIGH - Vacant unit with tenant lock', 0)}")
+        print(f"   High Severity: {summary['severity_breakdown'].get(SEVERITY_HIGH_VACANT, 0)}")
         
         logger.info(f"Enhanced Excel report saved to {output_excel}")
         print(f"[SUCCESS] Excel report successfully created: {output_excel}")
@@ -132,14 +140,13 @@ Examples:
     
     # Validate input files exist
     if args.input:
-        if not Path(args.input).exists():
+        if find_missing_files([args.input]):
             print(f"[ERROR] Input file not found: {args.input}")
             sys.exit(1)
     else:
-        for file_path in [args.units, args.rentroll, args.locks]:
-            if not Path(file_path).exists():
-                print(f"[ERROR] File not found: {file_path}")
-                sys.exit(1)
+        for file_path in find_missing_files([args.units, args.rentroll, args.locks]):
+            print(f"[ERROR] File not found: {file_path}")
+            sys.exit(1)
     
     # Create output directory if it doesn't exist
     output_path = Path(args.output)
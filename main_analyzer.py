@@ -13,26 +13,44 @@ Author: StorEdge DaVinci Miscompare v1
 """
 
 import argparse
+import atexit
+import csv
+import queue
 import sys
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-import pandas as pd
 from datetime import datetime
 
-# Import our custom modules
-from src.unit_status_analyzer import UnitStatusAnalyzer
-from src.report_generator import ReportGenerator
-from src.enhanced_excel_exporter import EnhancedExcelExporter
+from src.utils.file_utils import find_missing_files
 
 def setup_logging(log_level: str = 'INFO'):
-    """Set up logging configuration."""
+    """
+    Set up logging configuration.
+    
+    Records are put on a queue and written to the console and log file by a
+    background QueueListener, so logging calls never block on I/O.
+    """
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    stream_handler = logging.StreamHandler(sys.stdout)
+    file_handler = logging.FileHandler('unit_analysis.log')
+    for handler in (stream_handler, file_handler):
+        handler.setFormatter(formatter)
+    
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, stream_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
+    # The listener's handlers apply the full format; only the message is
+    # rendered before enqueueing
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter('%(message)s'))
+    
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('unit_analysis.log')
-        ]
+        handlers=[queue_handler],
+        force=True  # replace handlers installed when src modules were imported
     )
 
 def validate_input_files(units_file: str, rentroll_file: str, locks_file: str):
@@ -43,13 +61,17 @@ def validate_input_files(units_file: str, rentroll_file: str, locks_file: str):
         (locks_file, 'locks.csv')
     ]
     
+    missing = set(find_missing_files(file_path for file_path, _ in files_to_check))
+    
     for file_path, file_type in files_to_check:
-        if not Path(file_path).exists():
+        if file_path in missing:
             raise FileNotFoundError(f"{file_type} file not found: {file_path}")
         
         try:
-            # Try to read the file to ensure it's valid CSV
-            pd.read_csv(file_path, nrows=1)
+            # Read the header row to ensure it's a readable CSV
+            with open(file_path, 'r', newline='') as f:
+                if next(csv.reader(f), None) is None:
+                    raise ValueError("file is empty")
         except Exception as e:
             raise ValueError(f"Error reading {file_type} file {file_path}: {str(e)}")
 
@@ -91,6 +113,12 @@ Examples:
     
     args = parser.parse_args()
     
+    # Import our custom modules only once arguments are valid, so --help and
+    # usage errors don't pay for pandas/matplotlib/openpyxl imports
+    from src.unit_status_analyzer import UnitStatusAnalyzer
+    from src.report_generator import ReportGenerator
+    from src.enhanced_excel_exporter import EnhancedExcelExporter
+    
     # Set up logging
     setup_logging(args.log_level)
     logger = logging.getLogger(__name__)
@@ -176,7 +204,7 @@ Examples:
         print(f"\nUnit Status Breakdown:")
         for status, count in summary['unit_status_breakdown'].items():
             print(f"  {status}: {count}")
-        print(f"\nHigh Severity Issues: {summary['severity_breakdown'].get('HIGH - Vacant unit with tenant lock', 0) + summary['severity_breakdown'].get('HIGH - Current tenant without proper lock', 0) + summary['severity_breakdown'].get('HIGH - Delinquent unit without lock', 0)}")
+        print(f"\nHigh Severity Issues: {summary['high_severity_total']}")
         print(f"\nOutput Directory: {output_path}")
         print("="*60)
         
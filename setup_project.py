@@ -3,6 +3,7 @@
 Project setup script for new data science projects
 """
 
+import shlex
 import subprocess
 import sys
 import os
@@ -11,13 +12,18 @@ from pathlib import Path
 def run_command(command, description):
     """Run a command and handle errors"""
     print(f"[INFO] {description}...")
+    # Run without an intermediate shell; commands are static strings
+    args = shlex.split(command) if isinstance(command, str) else list(command)
     try:
-        result = subprocess.run(command, shell=True, check=True, capture_output=True, text=True)
+        result = subprocess.run(args, check=True, capture_output=True, text=True)
         print(f"[SUCCESS] {description} completed successfully!")
         return True
     except subprocess.CalledProcessError as e:
         print(f"[ERROR] {description} failed: {e.stderr}")
         return False
+    except FileNotFoundError as e:
+        print(f"[ERROR] {description} failed: {e}")
+        return False
 
 def setup_project():
     """Set up the data science project"""
@@ -29,8 +35,12 @@ def setup_project():
         print("[ERROR] Python is not installed or not in PATH")
         return False
     
+    # Snapshot top-level entries once instead of stat()ing each path
+    with os.scandir(".") as it:
+        top_level = {entry.name for entry in it}
+    
     # Initialize Git repository
-    if not os.path.exists(".git"):
+    if ".git" not in top_level:
         run_command("git init", "Initializing Git repository")
         run_command("git add .", "Adding files to Git")
         run_command('git commit -m "Initial commit: Project setup"', "Creating initial commit")
@@ -38,7 +48,7 @@ def setup_project():
         print("[INFO] Git repository already exists")
     
     # Create virtual environment
-    if not os.path.exists("venv"):
+    if "venv" not in top_level:
         if run_command("py -m venv venv", "Creating virtual environment"):
             print("[INFO] To activate the virtual environment:")
             print("   Windows: venv\\Scripts\\activate")
@@ -47,7 +57,7 @@ def setup_project():
         print("[INFO] Virtual environment already exists")
     
     # Install requirements
-    if os.path.exists("requirements.txt"):
+    if "requirements.txt" in top_level:
         print("[INFO] To install dependencies, run:")
         print("   pip install -r requirements.txt")
     else:
@@ -64,7 +74,10 @@ def setup_project():
     ]
     
     for directory in directories:
-        Path(directory).mkdir(parents=True, exist_ok=True)
+        if os.path.isdir(directory):
+            print(f"[INFO] Directory already exists: {directory}")
+            continue
+        Path(directory).mkdir(parents=True)
         print(f"[INFO] Created directory: {directory}")
     
     print("\n[SUCCESS] Project setup completed!")
@@ -5,18 +5,23 @@ This module creates a professionally formatted Excel report with conditional for
 charts, and multiple sheets for comprehensive analysis results.
 """
 
+import numpy as np
 import pandas as pd
-import openpyxl
 from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
-from openpyxl.utils.dataframe import dataframe_to_rows
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.differential import DifferentialStyle
 from openpyxl.chart import PieChart, BarChart, Reference
-from openpyxl.formatting.rule import ColorScaleRule, CellIsRule
+from openpyxl.formatting.rule import Rule
 from openpyxl.utils import get_column_letter
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Column letters indexed by 1-based column number, covering every Excel column
+_COL_LETTERS = [None] + [get_column_letter(i) for i in range(1, 16385)]
+
 class EnhancedExcelExporter:
     """Creates enhanced Excel reports with professional formatting and charts."""
     
@@ -42,6 +47,7 @@ class EnhancedExcelExporter:
         self.header_font = Font(name='Calibri', size=12, bold=True, color='FFFFFF')
         self.data_font = Font(name='Calibri', size=10)
         self.title_font = Font(name='Calibri', size=14, bold=True)
+        self.severity_font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
         
         # Define fills
         self.header_fill = PatternFill(start_color=self.colors['header'], 
@@ -68,6 +74,21 @@ class EnhancedExcelExporter:
         # Define alignment
         self.center_alignment = Alignment(horizontal='center', vertical='center')
         self.left_alignment = Alignment(horizontal='left', vertical='center')
+        
+        # Named styles are registered once per workbook and assigned to cells by name
+        self.named_styles = [
+            NamedStyle(name='title', font=self.title_font),
+            NamedStyle(name='header', font=self.header_font, fill=self.header_fill,
+                       border=self.thin_border, alignment=self.center_alignment),
+            NamedStyle(name='data_default', font=self.data_font,
+                       border=self.thin_border, alignment=self.left_alignment),
+            NamedStyle(name='data_centered', font=self.data_font,
+                       border=self.thin_border, alignment=self.center_alignment),
+            NamedStyle(name='priority_high', font=self.severity_font, fill=self.high_severity_fill,
+                       border=self.thin_border, alignment=self.left_alignment),
+            NamedStyle(name='priority_medium', font=self.severity_font, fill=self.medium_severity_fill,
+                       border=self.thin_border, alignment=self.left_alignment),
+        ]
     
     def create_enhanced_report(self, analyzer_results: pd.DataFrame, output_path: str):
         """
@@ -75,47 +96,69 @@ class EnhancedExcelExporter:
         
         Args:
             analyzer_results (pd.DataFrame): Complete analysis results
-            output_path (str): Path to save the Excel file
+            output_path (str or file-like): Path or binary file object to
+                save the Excel file to
         """
         logger.info("Creating enhanced Excel report...")
         
-        # Create workbook
-        wb = Workbook()
-        
-        # Remove default sheet
-        wb.remove(wb.active)
-        
-        # Create all sheets
-        self._create_summary_sheet(wb, analyzer_results)
-        self._create_complete_analysis_sheet(wb, analyzer_results)
-        self._create_miscompares_sheet(wb, analyzer_results)
-        self._create_high_severity_sheet(wb, analyzer_results)
-        self._create_status_breakdown_sheet(wb, analyzer_results)
-        self._create_lock_breakdown_sheet(wb, analyzer_results)
-        self._create_detailed_analysis_sheet(wb, analyzer_results)
-        self._create_recommendations_sheet(wb, analyzer_results)
+        # Create a streaming workbook; rows are written out as they are appended
+        wb = Workbook(write_only=True)
+        for style in self.named_styles:
+            wb.add_named_style(style)
+        
+        # Compute the miscompare and severity masks once for every sheet
+        is_miscompare = analyzer_results['Is_Miscompare']
+        if not pd.api.types.is_bool_dtype(is_miscompare):
+            is_miscompare = is_miscompare.eq(True)
+        is_miscompare = is_miscompare.to_numpy()
+        severity = analyzer_results['Miscompare_Severity'].astype(str)
+        high_mask = severity.str.startswith('HIGH').to_numpy()
+        medium_mask = severity.str.startswith('MEDIUM').to_numpy()
+        
+        # Prepare the derived tables in worker threads while the first sheets
+        # are written; sheets are still emitted in order on this thread
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            miscompares = pool.submit(self._prepare_miscompares_data, analyzer_results.loc[is_miscompare])
+            status_breakdown = pool.submit(self._value_breakdown, analyzer_results['Final_Status'], 'Status')
+            lock_breakdown = pool.submit(self._value_breakdown, analyzer_results['Actual_Lock_Status'], 'Lock_Status')
+            cross_tab = pool.submit(self._prepare_cross_tab, analyzer_results)
+            
+            # Create all sheets
+            self._create_summary_sheet(wb, analyzer_results, is_miscompare, high_mask, medium_mask)
+            self._create_complete_analysis_sheet(wb, analyzer_results)
+            self._create_miscompares_sheet(wb, miscompares.result())
+            self._create_high_severity_sheet(wb, analyzer_results.loc[high_mask])
+            self._create_status_breakdown_sheet(wb, status_breakdown.result())
+            self._create_lock_breakdown_sheet(wb, lock_breakdown.result())
+            self._create_detailed_analysis_sheet(wb, cross_tab.result())
+            self._create_recommendations_sheet(wb, analyzer_results)
         
         # Save workbook
         wb.save(output_path)
-        logger.info(f"Enhanced Excel report saved to {output_path}")
+        if not hasattr(output_path, 'write'):  # no path to report for a buffer
+            logger.info(f"Enhanced Excel report saved to {output_path}")
     
-    def _create_summary_sheet(self, wb: Workbook, df: pd.DataFrame):
-        """Create summary statistics sheet with charts."""
-        ws = wb.create_sheet("Executive_Summary", 0)
+    def _create_summary_sheet(self, wb: Workbook, df: pd.DataFrame, is_miscompare, high_mask, medium_mask):
+        """
+        Create summary statistics sheet with charts.
         
-        # Add title
-        ws['A1'] = "StorEdge DaVinci Unit Status Analysis - Executive Summary"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:D1')
+        Args:
+            wb (Workbook): Workbook to add the sheet to
+            df (pd.DataFrame): Complete analysis results
+            is_miscompare (np.ndarray): Boolean mask of miscompare rows
+            high_mask (np.ndarray): Boolean mask of HIGH severity rows
+            medium_mask (np.ndarray): Boolean mask of MEDIUM severity rows
+        """
+        ws = wb.create_sheet("Executive_Summary", 0)
+        title = "StorEdge DaVinci Unit Status Analysis - Executive Summary"
         
         # Calculate summary statistics
         total_units = len(df)
-        miscompares = df[df['Is_Miscompare'] == True]
-        miscompare_count = len(miscompares)
+        miscompare_count = int(is_miscompare.sum())
         miscompare_rate = (miscompare_count / total_units) * 100
         
-        high_severity = len(miscompares[miscompares['Miscompare_Severity'].str.contains('HIGH', na=False)])
-        medium_severity = len(miscompares[miscompares['Miscompare_Severity'].str.contains('MEDIUM', na=False)])
+        high_severity = int((high_mask & is_miscompare).sum())
+        medium_severity = int((medium_mask & is_miscompare).sum())
         
         # Add summary data
         summary_data = [
@@ -127,85 +170,44 @@ class EnhancedExcelExporter:
             ['Units with No Issues', total_units - miscompare_count, f'{((total_units - miscompare_count)/total_units)*100:.1f}%']
         ]
         
+        # Column widths must be set before the first row is written
+        self._set_column_widths(ws, [[title]] + summary_data, max_width=20)
+        
+        # Add title
+        self._append_title(ws, title)
+        
         # Add data to sheet
-        for row_idx, row_data in enumerate(summary_data, start=3):
-            for col_idx, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 3:  # Header row
-                    cell.font = self.header_font
-                    cell.fill = self.header_fill
-                    cell.alignment = self.center_alignment
-                else:
-                    cell.font = self.data_font
-                    cell.alignment = self.center_alignment
-                cell.border = self.thin_border
-        
-        # Auto-adjust column widths
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 20)
-            ws.column_dimensions[column_letter].width = adjusted_width
+        self._append_header(ws, summary_data[0])
+        for row_data in summary_data[1:]:
+            ws.append([self._styled_cell(ws, value, 'data_centered') for value in row_data])
     
     def _create_complete_analysis_sheet(self, wb: Workbook, df: pd.DataFrame):
         """Create complete analysis sheet with conditional formatting."""
         ws = wb.create_sheet("Complete_Analysis")
         
         # Add data
-        for r in dataframe_to_rows(df, index=False, header=True):
-            ws.append(r)
-        
-        # Format header row
-        for cell in ws[1]:
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.center_alignment
-            cell.border = self.thin_border
-        
-        # Apply conditional formatting for miscompare severity
-        severity_col = None
-        for idx, cell in enumerate(ws[1], 1):
-            if cell.value == 'Miscompare_Severity':
-                severity_col = idx
-                break
-        
-        if severity_col:
-            # Apply color coding based on severity
-            for row in range(2, ws.max_row + 1):
-                cell = ws.cell(row=row, column=severity_col)
-                if cell.value and 'HIGH' in str(cell.value):
-                    cell.fill = self.high_severity_fill
-                    cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-                elif cell.value and 'MEDIUM' in str(cell.value):
-                    cell.fill = self.medium_severity_fill
-                    cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-                elif cell.value and 'No Issue' in str(cell.value):
-                    cell.fill = self.no_issue_fill
-                    cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-        
-        # Apply borders to all data cells
-        for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-            for cell in row:
-                cell.border = self.thin_border
-                if cell.row > 1:  # Data rows
-                    cell.font = self.data_font
-                    cell.alignment = self.left_alignment
-        
-        # Auto-adjust column widths
-        self._auto_adjust_columns(ws)
+        last_row = self._write_data_sheet(ws, df)
+        
+        # Color code miscompare severity; Excel applies the rules when the file is opened
+        if 'Miscompare_Severity' in df.columns:
+            severity_col = df.columns.get_loc('Miscompare_Severity') + 1
+            self._add_severity_formatting(ws, severity_col, last_row, [
+                ('HIGH', self.high_severity_fill),
+                ('MEDIUM', self.medium_severity_fill),
+                ('No Issue', self.no_issue_fill),
+            ])
     
-    def _create_miscompares_sheet(self, wb: Workbook, df: pd.DataFrame):
-        """Create miscompares sheet with priority sorting."""
-        ws = wb.create_sheet("Miscompares")
+    def _prepare_miscompares_data(self, miscompares: pd.DataFrame) -> pd.DataFrame:
+        """
+        Add priority and recommended actions to the miscompare rows.
         
-        # Filter miscompares and add priority
-        miscompares = df[df['Is_Miscompare'] == True].copy()
+        Args:
+            miscompares (pd.DataFrame): Rows flagged as miscompares
+            
+        Returns:
+            pd.DataFrame: Copy sorted by priority with Priority and Recommended_Action columns
+        """
+        miscompares = miscompares.copy()
         
         # Add priority column
         priority_order = {
@@ -219,69 +221,71 @@ class EnhancedExcelExporter:
         miscompares = miscompares.sort_values('Priority')
         
         # Add recommended actions
-        def get_recommended_action(severity):
-            if pd.isna(severity):
-                return 'Review lock assignment and correct as needed'
-            severity_str = str(severity)
-            if 'Vacant unit with tenant lock' in severity_str:
-                return 'Remove tenant lock and verify unit is truly vacant'
-            elif 'Current tenant without proper lock' in severity_str:
-                return 'Install proper tenant lock immediately'
-            elif 'Delinquent unit without lock' in severity_str:
-                return 'Install overlock or proceed to auction'
-            else:
-                return 'Review lock assignment and correct as needed'
+        action_map = {
+            'HIGH - Vacant unit with tenant lock': 'Remove tenant lock and verify unit is truly vacant',
+            'HIGH - Current tenant without proper lock': 'Install proper tenant lock immediately',
+            'HIGH - Delinquent unit without lock': 'Install overlock or proceed to auction'
+        }
         
-        miscompares['Recommended_Action'] = miscompares['Miscompare_Severity'].apply(get_recommended_action)
+        miscompares['Recommended_Action'] = (miscompares['Miscompare_Severity']
+                                             .map(action_map)
+                                             .fillna('Review lock assignment and correct as needed'))
         
-        # Add data to sheet
-        for r in dataframe_to_rows(miscompares, index=False, header=True):
-            ws.append(r)
+        return miscompares
+    
+    def _create_miscompares_sheet(self, wb: Workbook, miscompares: pd.DataFrame):
+        """Create miscompares sheet from the prepared, priority-sorted rows."""
+        ws = wb.create_sheet("Miscompares")
         
-        # Format the sheet
-        self._format_data_sheet(ws)
+        # Add data to sheet
+        self._write_data_sheet(ws, miscompares)
     
-    def _create_high_severity_sheet(self, wb: Workbook, df: pd.DataFrame):
+    def _create_high_severity_sheet(self, wb: Workbook, high_severity: pd.DataFrame):
         """Create high severity issues sheet."""
         ws = wb.create_sheet("High_Severity_Issues")
         
-        # Filter high severity issues
-        high_severity = df[df['Miscompare_Severity'].str.contains('HIGH', na=False)].copy()
-        
         if not high_severity.empty:
             # Add data to sheet
-            for r in dataframe_to_rows(high_severity, index=False, header=True):
-                ws.append(r)
-            
-            # Format the sheet with red highlighting
-            self._format_data_sheet(ws)
+            last_row = self._write_data_sheet(ws, high_severity)
             
             # Highlight severity column
-            for row in range(2, ws.max_row + 1):
-                for col in range(1, ws.max_column + 1):
-                    cell = ws.cell(row=row, column=col)
-                    if 'HIGH' in str(cell.value):
-                        cell.fill = self.high_severity_fill
-                        cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
+            severity_col = high_severity.columns.get_loc('Miscompare_Severity') + 1
+            self._add_severity_formatting(ws, severity_col, last_row,
+                                          [('HIGH', self.high_severity_fill)])
         else:
-            ws['A1'] = "No High Severity Issues Found"
-            ws['A1'].font = self.title_font
+            self._append_title(ws, "No High Severity Issues Found", merge=False)
+    
+    def _value_breakdown(self, series: pd.Series, label: str) -> pd.DataFrame:
+        """
+        Count each distinct value of a column with its share of the total.
+        
+        Args:
+            series (pd.Series): Column to break down
+            label (str): Header for the value column
+            
+        Returns:
+            pd.DataFrame: label, Count and Percentage columns, most frequent first
+        """
+        # Count on the integer category codes; missing values have code -1
+        categorical = series.astype('category')
+        codes = categorical.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(categorical.cat.categories))
+        
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        counts = counts[order]
+        return pd.DataFrame({
+            label: categorical.cat.categories[order],
+            'Count': counts,
+            'Percentage': np.round(counts / counts.sum() * 100, 1)
+        })
     
-    def _create_status_breakdown_sheet(self, wb: Workbook, df: pd.DataFrame):
+    def _create_status_breakdown_sheet(self, wb: Workbook, status_breakdown: pd.DataFrame):
         """Create unit status breakdown sheet with chart."""
         ws = wb.create_sheet("Unit_Status_Breakdown")
         
-        # Calculate breakdown
-        status_breakdown = df['Final_Status'].value_counts().reset_index()
-        status_breakdown.columns = ['Status', 'Count']
-        status_breakdown['Percentage'] = (status_breakdown['Count'] / status_breakdown['Count'].sum() * 100).round(1)
-        
         # Add data
-        for r in dataframe_to_rows(status_breakdown, index=False, header=True):
-            ws.append(r)
-        
-        # Format the sheet
-        self._format_data_sheet(ws)
+        last_row = self._write_data_sheet(ws, status_breakdown)
         
         # Add pie chart
         chart = PieChart()
@@ -289,29 +293,20 @@ class EnhancedExcelExporter:
         chart.height = 10
         chart.width = 15
         
-        data = Reference(ws, min_col=2, min_row=1, max_row=len(status_breakdown) + 1)
-        labels = Reference(ws, min_col=1, min_row=2, max_row=len(status_breakdown) + 1)
+        data = Reference(ws, min_col=2, min_row=1, max_row=last_row)
+        labels = Reference(ws, min_col=1, min_row=2, max_row=last_row)
         
         chart.add_data(data, titles_from_data=True)
         chart.set_categories(labels)
         
         ws.add_chart(chart, "E2")
     
-    def _create_lock_breakdown_sheet(self, wb: Workbook, df: pd.DataFrame):
+    def _create_lock_breakdown_sheet(self, wb: Workbook, lock_breakdown: pd.DataFrame):
         """Create lock status breakdown sheet with chart."""
         ws = wb.create_sheet("Lock_Status_Breakdown")
         
-        # Calculate breakdown
-        lock_breakdown = df['Actual_Lock_Status'].value_counts().reset_index()
-        lock_breakdown.columns = ['Lock_Status', 'Count']
-        lock_breakdown['Percentage'] = (lock_breakdown['Count'] / lock_breakdown['Count'].sum() * 100).round(1)
-        
         # Add data
-        for r in dataframe_to_rows(lock_breakdown, index=False, header=True):
-            ws.append(r)
-        
-        # Format the sheet
-        self._format_data_sheet(ws)
+        last_row = self._write_data_sheet(ws, lock_breakdown)
         
         # Add bar chart
         chart = BarChart()
@@ -319,36 +314,32 @@ class EnhancedExcelExporter:
         chart.height = 10
         chart.width = 15
         
-        data = Reference(ws, min_col=2, min_row=1, max_row=len(lock_breakdown) + 1)
-        categories = Reference(ws, min_col=1, min_row=2, max_row=len(lock_breakdown) + 1)
+        data = Reference(ws, min_col=2, min_row=1, max_row=last_row)
+        categories = Reference(ws, min_col=1, min_row=2, max_row=last_row)
         
         chart.add_data(data, titles_from_data=True)
         chart.set_categories(categories)
         
         ws.add_chart(chart, "E2")
     
-    def _create_detailed_analysis_sheet(self, wb: Workbook, df: pd.DataFrame):
+    def _prepare_cross_tab(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Cross-tabulate final status against lock status with row and column totals."""
+        cross_tab = df.groupby(['Final_Status', 'Actual_Lock_Status']).size().unstack(fill_value=0)
+        cross_tab['All'] = cross_tab.sum(axis=1)
+        cross_tab.loc['All'] = cross_tab.sum(axis=0)
+        return cross_tab
+    
+    def _create_detailed_analysis_sheet(self, wb: Workbook, cross_tab: pd.DataFrame):
         """Create detailed analysis sheet with cross-tabulation."""
         ws = wb.create_sheet("Detailed_Analysis")
         
-        # Create cross-tabulation
-        cross_tab = pd.crosstab(df['Final_Status'], df['Actual_Lock_Status'], margins=True)
-        
-        # Add data
-        for r in dataframe_to_rows(cross_tab, index=True, header=True):
-            ws.append(r)
-        
-        # Format the sheet
-        self._format_data_sheet(ws)
+        # Add data, with the status index flattened into the first column
+        self._write_data_sheet(ws, cross_tab.reset_index())
     
     def _create_recommendations_sheet(self, wb: Workbook, df: pd.DataFrame):
         """Create recommendations sheet with actionable items."""
         ws = wb.create_sheet("Recommendations")
-        
-        # Add title
-        ws['A1'] = "Action Items and Recommendations"
-        ws['A1'].font = self.title_font
-        ws.merge_cells('A1:D1')
+        title = "Action Items and Recommendations"
         
         # Create recommendations
         recommendations = [
@@ -370,59 +361,112 @@ class EnhancedExcelExporter:
              'Low - Process Improvement']
         ]
         
+        # Column widths must be set before the first row is written
+        self._set_column_widths(ws, [[title]] + recommendations)
+        
+        # Add title
+        self._append_title(ws, title)
+        
         # Add data
-        for row_idx, row_data in enumerate(recommendations, start=3):
-            for col_idx, value in enumerate(row_data, start=1):
-                cell = ws.cell(row=row_idx, column=col_idx, value=value)
-                if row_idx == 3:  # Header row
-                    cell.font = self.header_font
-                    cell.fill = self.header_fill
-                    cell.alignment = self.center_alignment
-                else:
-                    cell.font = self.data_font
-                    cell.alignment = self.left_alignment
-                    if col_idx == 1:  # Priority column
-                        if value == 'HIGH':
-                            cell.fill = self.high_severity_fill
-                            cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-                        elif value == 'MEDIUM':
-                            cell.fill = self.medium_severity_fill
-                            cell.font = Font(name='Calibri', size=10, bold=True, color='FFFFFF')
-                cell.border = self.thin_border
-        
-        # Auto-adjust column widths
-        self._auto_adjust_columns(ws)
+        self._append_header(ws, recommendations[0])
+        priority_styles = {'HIGH': 'priority_high', 'MEDIUM': 'priority_medium'}
+        for row_data in recommendations[1:]:
+            row = [self._styled_cell(ws, value, 'data_default') for value in row_data]
+            row[0].style = priority_styles.get(row_data[0], 'data_default')
+            ws.append(row)
+    
+    def _styled_cell(self, ws, value, style):
+        """Create a write-only cell using one of the registered named styles."""
+        cell = WriteOnlyCell(ws, value=value)
+        cell.style = style
+        return cell
+    
+    def _append_title(self, ws, title, merge=True):
+        """Write a title row followed by a blank spacer row."""
+        ws.append([self._styled_cell(ws, title, 'title')])
+        if merge:
+            ws.merged_cells.add('A1:D1')
+            ws.append([])
     
-    def _format_data_sheet(self, ws):
-        """Apply standard formatting to a data sheet."""
-        # Format header row
-        for cell in ws[1]:
-            cell.font = self.header_font
-            cell.fill = self.header_fill
-            cell.alignment = self.center_alignment
-            cell.border = self.thin_border
-        
-        # Apply borders and formatting to data rows
-        for row in ws.iter_rows(min_row=1, max_row=ws.max_row, min_col=1, max_col=ws.max_column):
-            for cell in row:
-                cell.border = self.thin_border
-                if cell.row > 1:  # Data rows
-                    cell.font = self.data_font
-                    cell.alignment = self.left_alignment
-        
-        # Auto-adjust column widths
-        self._auto_adjust_columns(ws)
+    def _append_header(self, ws, headers):
+        """Write a styled header row."""
+        ws.append([self._styled_cell(ws, value, 'header') for value in headers])
     
-    def _auto_adjust_columns(self, ws):
-        """Auto-adjust column widths based on content."""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+    def _write_data_sheet(self, ws, df: pd.DataFrame) -> int:
+        """Stream a DataFrame into a write-only sheet and return the last row written."""
+        self._set_column_widths_from_df(ws, df)
+        return self._append_df(ws, df)
+    
+    def _append_df(self, ws, df: pd.DataFrame) -> int:
+        """
+        Append a header row followed by one row per DataFrame record.
+        
+        Returns:
+            int: Number of rows written, which is also the last row number
+        """
+        self._append_header(ws, df.columns.tolist())
+        
+        # Convert to Python objects in one pass so openpyxl receives native
+        # types, and turn missing values into None so they become empty cells
+        # (copy=True: a single-block frame would otherwise give a read-only view)
+        values = df.to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = None
+        
+        for row in values.tolist():
+            ws.append([self._styled_cell(ws, value, 'data_default') for value in row])
+        return len(values) + 1
+    
+    def _add_severity_formatting(self, ws, col_idx, last_row, rules):
+        """
+        Highlight cells in a column whose text contains a severity keyword.
+        
+        Args:
+            ws: Worksheet to format
+            col_idx (int): 1-based column index to format
+            last_row (int): Last data row of the sheet
+            rules (list): (keyword, fill) pairs applied in order
+        """
+        if last_row < 2:
+            return
+        col_letter = _COL_LETTERS[col_idx]
+        cell_range = f"{col_letter}2:{col_letter}{last_row}"
+        for text, fill in rules:
+            ws.conditional_formatting.add(cell_range, Rule(
+                type='containsText', operator='containsText', text=text,
+                formula=[f'NOT(ISERROR(SEARCH("{text}",{col_letter}2)))'],
+                dxf=DifferentialStyle(font=self.severity_font, fill=fill)))
+    
+    def _set_column_widths(self, ws, rows, max_width=50):
+        """
+        Size columns to fit the values about to be written.
+        
+        Write-only sheets emit column widths ahead of the rows, so widths are
+        taken from the source values rather than from written cells.
+        """
+        max_lengths = {}
+        for row in rows:
+            for col_idx, value in enumerate(row, start=1):
+                if value is not None:
+                    max_lengths[col_idx] = max(max_lengths.get(col_idx, 0), len(str(value)))
+        
+        for col_idx, max_length in max_lengths.items():
+            ws.column_dimensions[_COL_LETTERS[col_idx]].width = min(max_length + 2, max_width)
+    
+    def _set_column_widths_from_df(self, ws, df: pd.DataFrame, max_width=50):
+        """
+        Size columns from the DataFrame without touching worksheet cells.
+        
+        Numeric and datetime columns get a fixed width; only text columns are
+        measured, using a vectorized string length per column.
+        """
+        for col_idx, (name, col) in enumerate(df.items(), start=1):
+            if pd.api.types.is_datetime64_any_dtype(col):
+                value_length = 18
+            elif pd.api.types.is_numeric_dtype(col):
+                value_length = 10
+            else:
+                value_length = col.astype(str).str.len().max()
+                value_length = 0 if pd.isna(value_length) else int(value_length)
+            
+            width = max(len(str(name)), value_length) + 2
+            ws.column_dimensions[_COL_LETTERS[col_idx]].width = min(width, max_width)
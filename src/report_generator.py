@@ -5,12 +5,9 @@ This module generates comprehensive reports and visualizations for unit status a
 """
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
 import numpy as np
+import importlib.util
+from functools import cached_property
 from pathlib import Path
 import logging
 
@@ -24,15 +21,47 @@ class ReportGenerator:
         Initialize the report generator.
         
         Args:
-            analyzer_results (pd.DataFrame): Results from UnitStatusAnalyzer
+            analyzer_results (pd.DataFrame): Results from UnitStatusAnalyzer.
+                It is never modified; report methods copy any subset they change.
         """
-        self.df = analyzer_results.copy()
+        # The status and severity columns hold a handful of distinct strings;
+        # as categoricals, counts, crosstabs and .str checks run on the codes.
+        # astype returns a new frame, so the analyzer results are left as they
+        # are; with copy-on-write (pandas 3) the untouched columns are shared,
+        # while older pandas copies them.
+        self.df = analyzer_results.astype(dict.fromkeys(
+            ('Final_Status', 'Actual_Lock_Status', 'Miscompare_Severity'), 'category'))
+        
+        # Normalize Is_Miscompare to a plain numpy bool column (object or
+        # nullable input, e.g. read back from CSV, counts only literal True)
+        if self.df['Is_Miscompare'].dtype != bool:
+            self.df['Is_Miscompare'] = (self.df['Is_Miscompare'].eq(True)
+                                        .fillna(False).astype(bool))
+        
+        # Classify rows once; every report below reuses these boolean masks
+        self._mask_miscompare = self.df['Is_Miscompare'].to_numpy()
+        
+        severity = self.df['Miscompare_Severity']
+        self._mask_high = severity.str.contains('HIGH', regex=False, na=False).to_numpy(dtype=bool)
+        self._mask_medium = severity.str.contains('MEDIUM', regex=False, na=False).to_numpy(dtype=bool)
+        
+        # Row positions of the miscompare subsets, so sheets can .take them
+        self._idx_miscompare = np.flatnonzero(self._mask_miscompare)
+        self._idx_high_miscompare = np.flatnonzero(self._mask_miscompare & self._mask_high)
+        
+        # Miscompare counts and rates per unit status, in status order
+        status_totals = self.df['Final_Status'].value_counts(sort=False).sort_index()
+        self._miscompare_by_status = (self.df.loc[self._mask_miscompare, 'Final_Status']
+                                      .value_counts(sort=False)
+                                      .reindex(status_totals.index, fill_value=0))
+        self._miscompare_rate = self._miscompare_by_status / status_totals * 100
+        
         self.setup_plotting_style()
     
     def setup_plotting_style(self):
         """Set up consistent plotting styles."""
-        plt.style.use('seaborn-v0_8')
-        sns.set_palette("husl")
+        # The matplotlib/seaborn style itself is applied lazily by the chart
+        # functions, so alert- or Excel-only callers never import them
         
         # Define colors for different statuses
         self.colors = {
@@ -46,85 +75,97 @@ class ReportGenerator:
             'No Lock Assigned': '#D3D3D3'  # Light Gray
         }
     
+    @cached_property
+    def _cross_tab(self) -> pd.DataFrame:
+        """Unit status vs lock status counts, shared by the dashboard and heatmap."""
+        return (self.df.groupby(['Final_Status', 'Actual_Lock_Status'], observed=True)
+                .size()
+                .unstack(fill_value=0))
+    
+    def _severity_colors(self, index) -> np.ndarray:
+        """Color severity labels red for HIGH, orange for MEDIUM and green otherwise."""
+        labels = pd.Index(index).astype(str)
+        return np.where(labels.str.contains('HIGH', regex=False), '#DC143C',
+                        np.where(labels.str.contains('MEDIUM', regex=False), '#FF6347', '#2E8B57'))
+    
+    def _rate_colors(self, rates) -> np.ndarray:
+        """Color miscompare rates red above 10%, orange above 5% and green otherwise."""
+        rates = np.asarray(rates)
+        return np.select([rates > 10, rates > 5], ['#DC143C', '#FF6347'], default='#2E8B57')
+    
     def create_summary_dashboard(self, output_path: str = None):
         """
         Create a comprehensive summary dashboard.
         
+        Each panel is its own small figure; the HTML page lays them out in a
+        two-column grid instead of one make_subplots figure.
+        
         Args:
-            output_path (str): Path to save the dashboard HTML file
+            output_path (str or file-like): Path or binary file object to
+                save the dashboard HTML to
+            
+        Returns:
+            list: The six dashboard figures, in page order
         """
         logger.info("Creating summary dashboard...")
+        import plotly.graph_objects as go
         
-        # Create subplots
-        fig = make_subplots(
-            rows=3, cols=2,
-            subplot_titles=[
-                'Unit Status Distribution',
-                'Lock Status Distribution', 
-                'Miscompare Severity',
-                'Unit Status vs Lock Status',
-                'Miscompares by Unit Status',
-                'Daily Miscompare Trend'
-            ],
-            specs=[
-                [{"type": "pie"}, {"type": "pie"}],
-                [{"type": "bar"}, {"type": "bar"}],
-                [{"type": "scatter"}, {"type": "bar"}]
-            ]
-        )
+        figures = []
         
         # 1. Unit Status Distribution (Pie Chart)
         unit_status_counts = self.df['Final_Status'].value_counts()
-        fig.add_trace(
+        figures.append(go.Figure(
             go.Pie(
                 labels=unit_status_counts.index,
                 values=unit_status_counts.values,
                 name="Unit Status",
                 marker_colors=[self.colors.get(status, '#808080') for status in unit_status_counts.index]
             ),
-            row=1, col=1
-        )
+            layout_title_text='Unit Status Distribution'
+        ))
         
         # 2. Lock Status Distribution (Pie Chart)
         lock_status_counts = self.df['Actual_Lock_Status'].value_counts()
-        fig.add_trace(
+        figures.append(go.Figure(
             go.Pie(
                 labels=lock_status_counts.index,
                 values=lock_status_counts.values,
                 name="Lock Status",
                 marker_colors=[self.colors.get(status, '#808080') for status in lock_status_counts.index]
             ),
-            row=1, col=2
-        )
+            layout_title_text='Lock Status Distribution'
+        ))
         
         # 3. Miscompare Severity (Bar Chart)
         severity_counts = self.df['Miscompare_Severity'].value_counts()
-        fig.add_trace(
+        figures.append(go.Figure(
             go.Bar(
                 x=severity_counts.index,
                 y=severity_counts.values,
                 name="Miscompare Severity",
-                marker_color=['#DC143C' if 'HIGH' in str(x) else '#FF6347' if 'MEDIUM' in str(x) else '#2E8B57' 
-                             for x in severity_counts.index]
+                marker_color=self._severity_colors(severity_counts.index)
             ),
-            row=2, col=1
-        )
+            layout_title_text='Miscompare Severity'
+        ))
         
         # 4. Unit Status vs Lock Status (Bar Chart)
-        cross_tab = pd.crosstab(self.df['Final_Status'], self.df['Actual_Lock_Status'])
-        for lock_status in cross_tab.columns:
-            fig.add_trace(
+        cross_tab = self._cross_tab
+        figures.append(go.Figure(
+            [
                 go.Bar(
                     x=cross_tab.index,
                     y=cross_tab[lock_status],
                     name=lock_status,
                     marker_color=self.colors.get(lock_status, '#808080')
-                ),
-                row=2, col=2
-            )
+                )
+                for lock_status in cross_tab.columns
+            ],
+            layout_title_text='Unit Status vs Lock Status'
+        ))
         
         # 5. Miscompares by Unit Status (Scatter Plot)
-        miscompares = self.df[self.df['Is_Miscompare'] == True]
+        miscompares = self.df.take(self._idx_miscompare)
+        fig = go.Figure(layout_title_text='Miscompares by Unit Status')
         if not miscompares.empty:
             fig.add_trace(
                 go.Scatter(
@@ -139,93 +180,99 @@ class ReportGenerator:
                     name="Miscompares",
                     text=miscompares['Unit'],
                     hovertemplate="Unit: %{text}<br>Status: %{x}<br>Lock: %{y}<extra></extra>"
-                ),
-                row=3, col=1
+                )
             )
+        figures.append(fig)
         
         # 6. Miscompare Rate by Status (Bar Chart)
-        miscompare_rate = self.df.groupby('Final_Status')['Is_Miscompare'].mean() * 100
-        fig.add_trace(
+        miscompare_rate = self._miscompare_rate
+        figures.append(go.Figure(
             go.Bar(
                 x=miscompare_rate.index,
                 y=miscompare_rate.values,
                 name="Miscompare Rate %",
-                marker_color=['#DC143C' if x > 10 else '#FF6347' if x > 5 else '#2E8B57' 
-                             for x in miscompare_rate.values]
+                marker_color=self._rate_colors(miscompare_rate.values)
             ),
-            row=3, col=2
-        )
+            layout_title_text='Daily Miscompare Trend'
+        ))
         
-        # Update layout
-        fig.update_layout(
-            title_text="StorEdge DaVinci Unit Status Analysis Dashboard",
-            title_x=0.5,
-            height=1200,
-            showlegend=True
-        )
+        for fig in figures:
+            fig.update_layout(height=400, title_x=0.5, showlegend=True)
         
         # Save dashboard
         if output_path:
-            fig.write_html(output_path)
-            logger.info(f"Dashboard saved to {output_path}")
+            _write_dashboard_html(figures, output_path)
+            if not hasattr(output_path, 'write'):  # no path to report for a buffer
+                logger.info(f"Dashboard saved to {output_path}")
         
-        return fig
+        return figures
     
     def create_detailed_report(self, output_path: str):
         """
         Create a detailed Excel report with multiple sheets.
         
         Args:
-            output_path (str): Path to save the Excel report
+            output_path (str or file-like): Path or binary file object to
+                save the Excel report to
         """
         logger.info("Creating detailed Excel report...")
         
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
+        sheets = [
             # Main analysis results
-            self.df.to_excel(writer, sheet_name='Complete_Analysis', index=False)
-            
-            # Summary statistics
-            summary_data = self._create_summary_data()
-            summary_df = pd.DataFrame(list(summary_data.items()), columns=['Metric', 'Value'])
-            summary_df.to_excel(writer, sheet_name='Summary', index=False)
-            
-            # Miscompares only
-            miscompares = self.df[self.df['Is_Miscompare'] == True]
-            if not miscompares.empty:
-                miscompares.to_excel(writer, sheet_name='Miscompares', index=False)
-            
-            # High severity miscompares
-            high_severity = miscompares[miscompares['Miscompare_Severity'].str.contains('HIGH', na=False)]
-            if not high_severity.empty:
-                high_severity.to_excel(writer, sheet_name='High_Severity', index=False)
-            
-            # Unit status breakdown
-            status_breakdown = self.df['Final_Status'].value_counts().reset_index()
-            status_breakdown.columns = ['Status', 'Count']
-            status_breakdown.to_excel(writer, sheet_name='Status_Breakdown', index=False)
-            
-            # Lock status breakdown
-            lock_breakdown = self.df['Actual_Lock_Status'].value_counts().reset_index()
-            lock_breakdown.columns = ['Lock_Status', 'Count']
-            lock_breakdown.to_excel(writer, sheet_name='Lock_Breakdown', index=False)
+            ('Complete_Analysis', self.df),
+        ]
         
-        logger.info(f"Detailed report saved to {output_path}")
+        # Summary statistics
+        summary_data = self._create_summary_data()
+        sheets.append(('Summary', pd.DataFrame(list(summary_data.items()), columns=['Metric', 'Value'])))
+        
+        # Miscompares only
+        miscompares = self.df.take(self._idx_miscompare)
+        if not miscompares.empty:
+            sheets.append(('Miscompares', miscompares))
+        
+        # High severity miscompares
+        high_severity = self.df.take(self._idx_high_miscompare)
+        if not high_severity.empty:
+            sheets.append(('High_Severity', high_severity))
+        
+        # Unit status breakdown
+        sheets.append(('Status_Breakdown', self.df['Final_Status'].value_counts()
+                       .rename_axis('Status').reset_index(name='Count')))
+        
+        # Lock status breakdown
+        sheets.append(('Lock_Breakdown', self.df['Actual_Lock_Status'].value_counts()
+                       .rename_axis('Lock_Status').reset_index(name='Count')))
+        
+        if importlib.util.find_spec('xlsxwriter') is not None:
+            # xlsxwriter writes values-only sheets much faster than openpyxl. Its
+            # constant_memory mode is not used: pandas writes cells column by column,
+            # and constant_memory drops anything not written row by row.
+            with pd.ExcelWriter(output_path, engine='xlsxwriter') as writer:
+                for sheet_name, sheet_df in sheets:
+                    sheet_df.to_excel(writer, sheet_name=sheet_name, index=False)
+        else:
+            _write_sheets_write_only(sheets, output_path)
+        
+        if not hasattr(output_path, 'write'):  # no path to report for a buffer
+            logger.info(f"Detailed report saved to {output_path}")
     
     def _create_summary_data(self) -> dict:
         """Create summary statistics for the report."""
         total_units = len(self.df)
-        miscompare_count = self.df['Is_Miscompare'].sum()
+        miscompare_count = int(self._mask_miscompare.sum())
         miscompare_rate = (miscompare_count / total_units) * 100
+        status_counts = self.df['Final_Status'].value_counts()
         
         summary = {
             'Total Units': total_units,
             'Total Miscompares': miscompare_count,
             'Miscompare Rate (%)': round(miscompare_rate, 2),
-            'Vacant Units': len(self.df[self.df['Final_Status'] == 'Vacant']),
-            'Occupied-Current Units': len(self.df[self.df['Final_Status'] == 'Occupied-Current']),
-            'Occupied-Delinquent Units': len(self.df[self.df['Final_Status'] == 'Occupied-Delinquent']),
-            'High Severity Miscompares': len(self.df[self.df['Miscompare_Severity'].str.contains('HIGH', na=False)]),
-            'Medium Severity Miscompares': len(self.df[self.df['Miscompare_Severity'].str.contains('MEDIUM', na=False)])
+            'Vacant Units': int(status_counts.get('Vacant', 0)),
+            'Occupied-Current Units': int(status_counts.get('Occupied-Current', 0)),
+            'Occupied-Delinquent Units': int(status_counts.get('Occupied-Delinquent', 0)),
+            'High Severity Miscompares': int(self._mask_high.sum()),
+            'Medium Severity Miscompares': int(self._mask_medium.sum())
         }
         
         return summary
@@ -234,120 +281,45 @@ class ReportGenerator:
         """
         Create a suite of individual visualizations.
         
+        Each chart is drawn from a small pre-aggregated table rather than the
+        full frame, in this process with the non-interactive Agg backend.
+        
         Args:
             output_dir (str): Directory to save visualization files
+            
+        Returns:
+            list: Paths of the written image files, in chart order
         """
         logger.info("Creating visualization suite...")
         
         output_path = Path(output_dir)
         output_path.mkdir(parents=True, exist_ok=True)
         
-        # 1. Unit Status Distribution
-        self._create_unit_status_chart(output_path / 'unit_status_distribution.png')
-        
-        # 2. Lock Status Distribution
-        self._create_lock_status_chart(output_path / 'lock_status_distribution.png')
-        
-        # 3. Miscompare Analysis
-        self._create_miscompare_chart(output_path / 'miscompare_analysis.png')
+        colors = self.colors
+        jobs = [
+            # 1. Unit Status Distribution
+            (_plot_unit_status_chart, self.df['Final_Status'].value_counts(),
+             colors, output_path / 'unit_status_distribution.png'),
+            # 2. Lock Status Distribution
+            (_plot_lock_status_chart, self.df['Actual_Lock_Status'].value_counts(),
+             colors, output_path / 'lock_status_distribution.png'),
+            # 3. Miscompare Analysis
+            (_plot_miscompare_chart, self._miscompare_by_status, self._miscompare_rate,
+             colors, self._rate_colors(self._miscompare_rate.values),
+             output_path / 'miscompare_analysis.png'),
+            # 4. Cross-tabulation Heatmap
+            (_plot_heatmap, self._cross_tab, output_path / 'status_cross_tabulation.png'),
+        ]
         
-        # 4. Cross-tabulation Heatmap
-        self._create_heatmap(output_path / 'status_cross_tabulation.png')
+        # Rendered sequentially on purpose: a process pool was tried and
+        # dropped, since each worker re-imported matplotlib/seaborn (slower
+        # than drawing four small charts) and forking from the multi-threaded
+        # Streamlit server can deadlock
+        for func, *args in jobs:
+            func(*args)
         
         logger.info(f"Visualization suite saved to {output_dir}")
-    
-    def _create_unit_status_chart(self, output_path: Path):
-        """Create unit status distribution chart."""
-        plt.figure(figsize=(10, 6))
-        status_counts = self.df['Final_Status'].value_counts()
-        colors = [self.colors.get(status, '#808080') for status in status_counts.index]
-        
-        plt.pie(status_counts.values, labels=status_counts.index, autopct='%1.1f%%', 
-                colors=colors, startangle=90)
-        plt.title('Unit Status Distribution', fontsize=16, fontweight='bold')
-        plt.axis('equal')
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    
-    def _create_lock_status_chart(self, output_path: Path):
-        """Create lock status distribution chart."""
-        plt.figure(figsize=(12, 6))
-        lock_counts = self.df['Actual_Lock_Status'].value_counts()
-        colors = [self.colors.get(status, '#808080') for status in lock_counts.index]
-        
-        bars = plt.bar(lock_counts.index, lock_counts.values, color=colors)
-        plt.title('Lock Status Distribution', fontsize=16, fontweight='bold')
-        plt.xlabel('Lock Status')
-        plt.ylabel('Number of Units')
-        plt.xticks(rotation=45, ha='right')
-        
-        # Add value labels on bars
-        for bar in bars:
-            height = bar.get_height()
-            plt.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{int(height)}', ha='center', va='bottom')
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    
-    def _create_miscompare_chart(self, output_path: Path):
-        """Create miscompare analysis chart."""
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
-        
-        # Miscompare count by status
-        miscompare_by_status = self.df.groupby('Final_Status')['Is_Miscompare'].sum()
-        colors = [self.colors.get(status, '#808080') for status in miscompare_by_status.index]
-        
-        bars1 = ax1.bar(miscompare_by_status.index, miscompare_by_status.values, color=colors)
-        ax1.set_title('Miscompares by Unit Status', fontweight='bold')
-        ax1.set_ylabel('Number of Miscompares')
-        ax1.tick_params(axis='x', rotation=45)
-        
-        # Add value labels
-        for bar in bars1:
-            height = bar.get_height()
-            ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
-                    f'{int(height)}', ha='center', va='bottom')
-        
-        # Miscompare rate by status
-        miscompare_rate = self.df.groupby('Final_Status')['Is_Miscompare'].mean() * 100
-        colors = ['#DC143C' if x > 10 else '#FF6347' if x > 5 else '#2E8B57' 
-                 for x in miscompare_rate.values]
-        
-        bars2 = ax2.bar(miscompare_rate.index, miscompare_rate.values, color=colors)
-        ax2.set_title('Miscompare Rate by Unit Status', fontweight='bold')
-        ax2.set_ylabel('Miscompare Rate (%)')
-        ax2.tick_params(axis='x', rotation=45)
-        
-        # Add value labels
-        for bar in bars2:
-            height = bar.get_height()
-            ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                    f'{height:.1f}%', ha='center', va='bottom')
-        
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
-    
-    def _create_heatmap(self, output_path: Path):
-        """Create cross-tabulation heatmap."""
-        plt.figure(figsize=(12, 8))
-        
-        # Create cross-tabulation
-        cross_tab = pd.crosstab(self.df['Final_Status'], self.df['Actual_Lock_Status'])
-        
-        # Create heatmap
-        sns.heatmap(cross_tab, annot=True, fmt='d', cmap='YlOrRd', 
-                   cbar_kws={'label': 'Number of Units'})
-        plt.title('Unit Status vs Lock Status Cross-Tabulation', 
-                 fontsize=16, fontweight='bold')
-        plt.xlabel('Lock Status')
-        plt.ylabel('Unit Status')
-        plt.tight_layout()
-        plt.savefig(output_path, dpi=300, bbox_inches='tight')
-        plt.close()
+        return [str(args[-1]) for func, *args in jobs]
     
     def generate_alert_report(self) -> pd.DataFrame:
         """
@@ -358,7 +330,7 @@ class ReportGenerator:
         """
         logger.info("Generating alert report...")
         
-        miscompares = self.df[self.df['Is_Miscompare'] == True].copy()
+        miscompares = self.df[self._mask_miscompare].copy()
         
         if miscompares.empty:
             logger.info("No miscompares found - no alerts to generate")
@@ -372,22 +344,21 @@ class ReportGenerator:
             'MEDIUM - Lock status mismatch': 4
         }
         
-        miscompares['Priority'] = miscompares['Miscompare_Severity'].map(priority_order)
-        miscompares = miscompares.sort_values('Priority')
+        # Map from plain strings so the new columns are not categoricals
+        severity = miscompares['Miscompare_Severity'].astype(object)
+        miscompares['Priority'] = severity.map(priority_order)
         
         # Add recommended actions
-        def get_recommended_action(row):
-            severity = row['Miscompare_Severity']
-            if 'Vacant unit with tenant lock' in severity:
-                return 'Remove tenant lock and verify unit is truly vacant'
-            elif 'Current tenant without proper lock' in severity:
-                return 'Install proper tenant lock immediately'
-            elif 'Delinquent unit without lock' in severity:
-                return 'Install overlock or proceed to auction'
-            else:
-                return 'Review lock assignment and correct as needed'
-        
-        miscompares['Recommended_Action'] = miscompares.apply(get_recommended_action, axis=1)
+        action_map = {
+            'HIGH - Vacant unit with tenant lock': 'Remove tenant lock and verify unit is truly vacant',
+            'HIGH - Current tenant without proper lock': 'Install proper tenant lock immediately',
+            'HIGH - Delinquent unit without lock': 'Install overlock or proceed to auction'
+        }
+        
+        miscompares['Recommended_Action'] = (severity
+                                             .map(action_map)
+                                             .fillna('Review lock assignment and correct as needed'))
+        miscompares = miscompares.sort_values('Priority')
         
         # Select relevant columns for alert report
         alert_columns = [
@@ -403,6 +374,186 @@ class ReportGenerator:
         
         Args:
             output_dir (str): Directory to save visualization files
+            
+        Returns:
+            list: Paths of the written image files
         """
         logger.info("Creating individual visualizations...")
         return self.create_visualization_suite(output_dir)
+
+
+def _write_sheets_write_only(sheets: list, output_path: str):
+    """
+    Write (sheet name, DataFrame) pairs with an openpyxl write-only workbook.
+    
+    Rows are streamed to disk as they are appended, so memory stays flat
+    regardless of sheet size; used when xlsxwriter is not installed.
+    
+    Args:
+        sheets (list): (sheet name, DataFrame) pairs in workbook order
+        output_path (str or file-like): Path or binary file object to save to
+    """
+    from openpyxl import Workbook
+    
+    wb = Workbook(write_only=True)
+    for sheet_name, sheet_df in sheets:
+        ws = wb.create_sheet(sheet_name)
+        ws.append(sheet_df.columns.tolist())
+        # copy=True: a single-dtype frame would otherwise give a read-only view
+        values = sheet_df.to_numpy(dtype=object, copy=True)
+        values[pd.isna(values)] = None  # blank cells, as to_excel writes them
+        for row in values.tolist():
+            ws.append(row)
+    wb.save(output_path)
+
+
+_DASHBOARD_TITLE = "StorEdge DaVinci Unit Status Analysis Dashboard"
+
+_DASHBOARD_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<title>{title}</title>
+<style>
+body {{ font-family: "Open Sans", Arial, sans-serif; margin: 16px; }}
+h1 {{ text-align: center; font-weight: normal; }}
+.dashboard {{ display: grid; grid-template-columns: repeat(2, minmax(0, 1fr)); gap: 16px; }}
+</style>
+</head>
+<body>
+<h1>{title}</h1>
+<div class="dashboard">
+{panels}
+</div>
+</body>
+</html>
+"""
+
+
+def _write_dashboard_html(figures: list, output_path: str):
+    """Write dashboard figures into one HTML page, loading plotly.js once from the CDN."""
+    panels = [
+        fig.to_html(full_html=False, include_plotlyjs='cdn' if i == 0 else False,
+                    div_id=f'dashboard-panel-{i + 1}')
+        for i, fig in enumerate(figures)
+    ]
+    html = _DASHBOARD_TEMPLATE.format(title=_DASHBOARD_TITLE, panels='\n'.join(panels))
+    if hasattr(output_path, 'write'):
+        output_path.write(html.encode('utf-8'))
+    else:
+        Path(output_path).write_text(html, encoding='utf-8')
+
+
+_STYLE_SET = False
+
+
+def _plotting_modules():
+    """
+    Import pyplot and seaborn on first use and apply the shared style once per
+    process.
+    
+    Returns:
+        tuple: The matplotlib.pyplot and seaborn modules
+    """
+    global _STYLE_SET
+    import matplotlib
+    if not _STYLE_SET:
+        matplotlib.use('Agg')  # charts are only ever saved to files
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    if not _STYLE_SET:
+        plt.style.use('seaborn-v0_8')
+        sns.set_palette("husl")
+        _STYLE_SET = True
+    return plt, sns
+
+
+def _plot_unit_status_chart(status_counts: pd.Series, colors: dict, output_path: Path):
+    """Create unit status distribution chart."""
+    plt, _ = _plotting_modules()
+    plt.figure(figsize=(10, 6))
+    pie_colors = [colors.get(status, '#808080') for status in status_counts.index]
+    
+    plt.pie(status_counts.values, labels=status_counts.index, autopct='%1.1f%%', 
+            colors=pie_colors, startangle=90)
+    plt.title('Unit Status Distribution', fontsize=16, fontweight='bold')
+    plt.axis('equal')
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def _plot_lock_status_chart(lock_counts: pd.Series, colors: dict, output_path: Path):
+    """Create lock status distribution chart."""
+    plt, _ = _plotting_modules()
+    plt.figure(figsize=(12, 6))
+    bar_colors = [colors.get(status, '#808080') for status in lock_counts.index]
+    
+    bars = plt.bar(lock_counts.index, lock_counts.values, color=bar_colors)
+    plt.title('Lock Status Distribution', fontsize=16, fontweight='bold')
+    plt.xlabel('Lock Status')
+    plt.ylabel('Number of Units')
+    plt.xticks(rotation=45, ha='right')
+    
+    # Add value labels on bars
+    for bar in bars:
+        height = bar.get_height()
+        plt.text(bar.get_x() + bar.get_width()/2., height + 0.5,
+                f'{int(height)}', ha='center', va='bottom')
+    
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def _plot_miscompare_chart(miscompare_by_status: pd.Series, miscompare_rate: pd.Series,
+                           colors: dict, rate_colors, output_path: Path):
+    """Create miscompare analysis chart."""
+    plt, _ = _plotting_modules()
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
+    
+    # Miscompare count by status
+    status_colors = [colors.get(status, '#808080') for status in miscompare_by_status.index]
+    
+    bars1 = ax1.bar(miscompare_by_status.index, miscompare_by_status.values, color=status_colors)
+    ax1.set_title('Miscompares by Unit Status', fontweight='bold')
+    ax1.set_ylabel('Number of Miscompares')
+    ax1.tick_params(axis='x', rotation=45)
+    
+    # Add value labels
+    for bar in bars1:
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height + 0.1,
+                f'{int(height)}', ha='center', va='bottom')
+    
+    # Miscompare rate by status
+    bars2 = ax2.bar(miscompare_rate.index, miscompare_rate.values, color=rate_colors)
+    ax2.set_title('Miscompare Rate by Unit Status', fontweight='bold')
+    ax2.set_ylabel('Miscompare Rate (%)')
+    ax2.tick_params(axis='x', rotation=45)
+    
+    # Add value labels
+    for bar in bars2:
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height + 0.5,
+                f'{height:.1f}%', ha='center', va='bottom')
+    
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.close()
+
+
+def _plot_heatmap(cross_tab: pd.DataFrame, output_path: Path):
+    """Create cross-tabulation heatmap."""
+    plt, sns = _plotting_modules()
+    plt.figure(figsize=(12, 8))
+    
+    sns.heatmap(cross_tab, annot=True, fmt='d', cmap='YlOrRd', 
+               cbar_kws={'label': 'Number of Units'})
+    plt.title('Unit Status vs Lock Status Cross-Tabulation', 
+             fontsize=16, fontweight='bold')
+    plt.xlabel('Lock Status')
+    plt.ylabel('Unit Status')
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=300, bbox_inches='tight')
+    plt.close()
@@ -5,7 +5,8 @@ This module handles storing analysis results and user sessions in Supabase.
 """
 
 import pandas as pd
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 import logging
@@ -14,6 +15,12 @@ from web_config import SUPABASE_CONFIG, DB_CONFIG
 
 logger = logging.getLogger(__name__)
 
+
+def _dumps_json(value) -> str:
+    """Serialize a value to a JSON string; numpy scalars from pandas summaries are accepted."""
+    return orjson.dumps(value, option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+
 class SupabaseManager:
     """Manages Supabase operations for the web application."""
     
@@ -51,8 +58,8 @@ class SupabaseManager:
                 "total_units": session_data.get("total_units", 0),
                 "miscompare_count": session_data.get("miscompare_count", 0),
                 "high_severity_count": session_data.get("high_severity_count", 0),
-                "analysis_summary": json.dumps(session_data.get("summary", {})),
-                "file_names": json.dumps(session_data.get("file_names", [])),
+                "analysis_summary": _dumps_json(session_data.get("summary", {})),
+                "file_names": _dumps_json(session_data.get("file_names", [])),
                 "status": "completed"
             }
             
@@ -75,6 +82,10 @@ class SupabaseManager:
         """
         Store detailed analysis results in Supabase.
         
+        Rows are inserted in batches, several at a time. Batches are not
+        transactional: when one fails, batches that have not started yet are
+        cancelled, but batches already sent (or in flight) stay committed.
+        
         Args:
             session_id: ID of the analysis session
             results_df: DataFrame containing analysis results
@@ -87,23 +98,34 @@ class SupabaseManager:
             return False
         
         try:
-            # Convert DataFrame to records
-            records = results_df.to_dict('records')
+            # Convert DataFrame to records, tagged with the session. Going
+            # through one object array gives native Python values, and
+            # missing values become None so they serialize as JSON null
+            # (copy=True: a single-dtype frame would otherwise give a
+            # read-only view).
+            columns = results_df.columns.tolist()
+            values = results_df.to_numpy(dtype=object, copy=True)
+            values[pd.isna(values)] = None
+            created_at = datetime.now().isoformat()
+            records = [
+                dict(zip(columns, row), session_id=session_id, created_at=created_at)
+                for row in values.tolist()
+            ]
             
-            # Add session_id to each record
-            for record in records:
-                record["session_id"] = session_id
-                record["created_at"] = datetime.now().isoformat()
-            
-            # Insert in batches to avoid size limits
+            # Insert in batches to avoid size limits; the requests are
+            # network-bound, so send several batches at once
             batch_size = 100
-            for i in range(0, len(records), batch_size):
-                batch = records[i:i + batch_size]
-                result = self.supabase.table("analysis_results").insert(batch).execute()
-                
-                if not result.data:
-                    logger.error(f"Failed to insert batch {i//batch_size + 1}")
-                    return False
+            batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+            executor = ThreadPoolExecutor(max_workers=8)
+            try:
+                futures = [executor.submit(self._insert_results_batch, batch) for batch in batches]
+                for batch_number, future in enumerate(futures, start=1):
+                    if not future.result().data:
+                        logger.error(f"Failed to insert batch {batch_number}")
+                        return False
+            finally:
+                # Stop sending batches after the first failure
+                executor.shutdown(cancel_futures=True)
             
             logger.info(f"Stored {len(records)} analysis results for session {session_id}")
             return True
@@ -112,6 +134,10 @@ class SupabaseManager:
             logger.error(f"Error storing analysis results: {e}")
             return False
     
+    def _insert_results_batch(self, batch: List[Dict]):
+        """Insert one batch of analysis result records."""
+        return self.supabase.table("analysis_results").insert(batch).execute()
+    
     def get_analysis_history(self, user_email: str = None, limit: int = 10) -> List[Dict]:
         """
         Retrieve analysis history for a user.
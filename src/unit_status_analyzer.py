@@ -10,6 +10,9 @@ It processes three CSV files: units.csv, rentroll.csv, and locks.csv to determin
 Author: StorEdge DaVinci Miscompare v1
 """
 
+import codecs
+import importlib.util
+import os
 import pandas as pd
 import numpy as np
 import logging
@@ -22,6 +25,132 @@ warnings.filterwarnings('ignore')
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Miscompare severity labels, as written to Miscompare_Severity and used as
+# summary['severity_breakdown'] keys
+SEVERITY_NONE = 'No Issue'
+SEVERITY_HIGH_VACANT = 'HIGH - Vacant unit with tenant lock'
+SEVERITY_HIGH_CURRENT = 'HIGH - Current tenant without proper lock'
+SEVERITY_HIGH_DELINQUENT = 'HIGH - Delinquent unit without lock'
+SEVERITY_MEDIUM = 'MEDIUM - Lock status mismatch'
+
+# CSV parser used by read_csv_fast; set STOREDGE_CSV_ENGINE=c to always use
+# the pandas C engine (e.g. to rule out parser differences when debugging)
+CSV_ENGINE = os.environ.get("STOREDGE_CSV_ENGINE", "pyarrow")
+
+# Unit identifiers are kept as Arrow strings (one UTF-8 buffer instead of a
+# Python object per row) so strip, merge and membership tests run in Arrow
+# kernels; plain Python strings are used when pyarrow is not installed
+if importlib.util.find_spec("pyarrow") is not None:
+    import pyarrow as pa
+    UNIT_DTYPE = pd.ArrowDtype(pa.string())
+else:
+    UNIT_DTYPE = None
+
+def clean_unit_ids(series: pd.Series) -> pd.Series:
+    """
+    Convert unit identifiers to strings with surrounding whitespace removed.
+    
+    Args:
+        series (pd.Series): Raw unit identifier column
+        
+    Returns:
+        pd.Series: Stripped identifiers, Arrow-backed when pyarrow is available
+    """
+    if UNIT_DTYPE is None:
+        return series.astype(str).str.strip()
+    return series.astype(UNIT_DTYPE).str.strip()
+
+def read_csv_fast(file_path, **kwargs) -> pd.DataFrame:
+    """
+    Read a CSV file using pyarrow's multithreaded parser when available.
+    
+    Falls back to the default pandas C engine if pyarrow is not installed or
+    rejects the file (e.g. bytes that are not valid in the requested encoding),
+    so callers get the same exceptions they would from ``pd.read_csv``.
+    Columns stay NumPy-backed either way.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        **kwargs: Additional arguments passed to ``pd.read_csv``; a callable
+            ``usecols`` is resolved against the header first, since the
+            pyarrow engine only accepts a list of column names
+        
+    Returns:
+        pd.DataFrame: Parsed CSV data
+    """
+    usecols = kwargs.get('usecols')
+    if callable(usecols):
+        header = pd.read_csv(file_path, nrows=0, encoding=kwargs.get('encoding')).columns
+        kwargs['usecols'] = [col for col in header if usecols(col)]
+        if isinstance(kwargs.get('dtype'), dict):
+            kwargs['dtype'] = {col: dtype for col, dtype in kwargs['dtype'].items()
+                               if col in kwargs['usecols']}
+    
+    if CSV_ENGINE != 'pyarrow':
+        return pd.read_csv(file_path, **kwargs)
+    
+    try:
+        df = pd.read_csv(file_path, engine='pyarrow', **kwargs)
+    except (ImportError, ValueError):
+        return pd.read_csv(file_path, **kwargs)
+    
+    # pyarrow keeps undecodable text as raw bytes instead of raising (also
+    # inside the categories of a 'category' column), so re-read with the C
+    # engine to surface the UnicodeDecodeError
+    for col in df.columns:
+        values = df[col]
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            values = values.cat.categories
+        elif values.dtype != object:
+            continue
+        if any(isinstance(value, bytes) for value in values.dropna()[:1]):
+            return pd.read_csv(file_path, **kwargs)
+    return df
+
+def candidate_encodings(file_path, sample_size: int = 65536) -> List[str]:
+    """
+    Order the supported CSV encodings with the likely one first.
+    
+    Loaders normally parse the file once with the first encoding and only
+    fall through to the rest if a later byte disagrees.
+    
+    Args:
+        file_path (str): Path to the CSV file
+        sample_size (int): Number of leading bytes to inspect
+        
+    Returns:
+        List[str]: Encodings to try, in order
+    """
+    with open(file_path, 'rb') as f:
+        sample = f.read(sample_size)
+    return sample_encodings(sample)
+
+def sample_encodings(sample: bytes) -> List[str]:
+    """
+    Order the supported CSV encodings by how well they decode a byte sample.
+    
+    The sample is decoded strictly as UTF-8, then cp1252; the first that
+    succeeds leads the list (latin-1 otherwise, which accepts any byte).
+    
+    Args:
+        sample (bytes): Leading bytes of the file
+        
+    Returns:
+        List[str]: Encodings to try, in order
+    """
+    detected = 'latin-1'
+    for encoding in ('utf-8', 'cp1252'):
+        try:
+            # final=False tolerates a multi-byte character cut at the sample end
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+        except UnicodeDecodeError:
+            continue
+        detected = encoding
+        break
+    
+    fallbacks = ['utf-8', 'cp1252', 'latin-1']
+    return [detected] + [encoding for encoding in fallbacks if encoding != detected]
+
 class UnitStatusAnalyzer:
     """
     Analyzes self-storage unit status and lock assignments for miscompare detection.
@@ -48,6 +177,20 @@ class UnitStatusAnalyzer:
             'Assigned Auction',
             'Assigned Overlock'
         ]
+        
+        # Miscompare flag and severity for every (final status, lock status)
+        # pair, indexed [final slot, lock slot]. The last slot on each axis
+        # stands for any other value (Unknown, unexpected lock text, missing);
+        # the rules treat all of those alike.
+        final_slots = np.array(list(self.expected_lock_status) + [None], dtype=object)
+        lock_slots = np.array(self.valid_lock_statuses + [None], dtype=object)
+        pair_miscompare, pair_severity = self._classify_lock_status(
+            pd.Series(np.repeat(final_slots, len(lock_slots))),
+            pd.Series(np.tile(lock_slots, len(final_slots)))
+        )
+        self._severity_labels, severity_codes = np.unique(pair_severity, return_inverse=True)
+        self._miscompare_lut = pair_miscompare.reshape(len(final_slots), len(lock_slots))
+        self._severity_lut = severity_codes.reshape(len(final_slots), len(lock_slots))
     
     def load_units_file(self, file_path: str) -> pd.DataFrame:
         """
@@ -63,12 +206,14 @@ class UnitStatusAnalyzer:
             logger.info(f"Loading units file: {file_path}")
             
             # Try different encodings for CSV files
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+            encodings = candidate_encodings(file_path)
             df = None
             
             for encoding in encodings:
                 try:
-                    df = pd.read_csv(file_path, encoding=encoding)
+                    df = read_csv_fast(file_path, encoding=encoding,
+                                       usecols=lambda col: col in ('Unit', 'Status'),
+                                       dtype={'Status': 'category'})
                     logger.info(f"Successfully read units file with {encoding} encoding")
                     break
                 except UnicodeDecodeError:
@@ -83,12 +228,18 @@ class UnitStatusAnalyzer:
             if missing_cols:
                 raise ValueError(f"Missing required columns in units.csv: {missing_cols}")
             
-            # Clean and process the data
-            df = df.copy()
-            df['Unit'] = df['Unit'].astype(str).str.strip()
+            # Clean and process the data (df was just read, so it is modified in place)
+            df['Unit'] = clean_unit_ids(df['Unit'])
             
-            # Extract unit status from first 3 characters
-            df['Status_Clean'] = df['Status'].astype(str).str[:3].str.upper()
+            # Extract unit status from first 3 characters. Status is read as a
+            # category, so the string work runs once per distinct status and
+            # rows just index the result by code; the extra last entry is
+            # picked by code -1, so missing statuses stay missing
+            status = df['Status'].astype('category')
+            status_clean = status.cat.categories.astype(str).str[:3].str.upper()
+            status_clean = np.append(status_clean.to_numpy(dtype=object), np.nan)
+            df['Status_Clean'] = pd.Series(status_clean[status.cat.codes.to_numpy()],
+                                           index=df.index, dtype=str)
             
             # Map to standard status
             status_mapping = {
@@ -103,6 +254,9 @@ class UnitStatusAnalyzer:
                 logger.warning(f"Found unmapped statuses: {unmapped['Status_Clean'].unique()}")
                 df['Unit_Status'] = df['Unit_Status'].fillna('Unknown')
             
+            # A handful of repeated labels; store them as category codes
+            df['Unit_Status'] = df['Unit_Status'].astype('category')
+            
             logger.info(f"Loaded {len(df)} units from units.csv")
             return df
             
@@ -123,13 +277,18 @@ class UnitStatusAnalyzer:
         try:
             logger.info(f"Loading rentroll file: {file_path}")
             
+            # Map possible column names
+            unit_col_candidates = ['Unit', 'UNIT', '"Unit"', '"UNIT"']
+            days_col_candidates = ['Days Past Due', 'DAYS PAST DUE', '"Days Past Due"', '"DAYS PAST DUE"']
+            
             # Try different encodings for CSV files
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+            encodings = candidate_encodings(file_path)
             df = None
             
             for encoding in encodings:
                 try:
-                    df = pd.read_csv(file_path, encoding=encoding)
+                    df = read_csv_fast(file_path, encoding=encoding,
+                                       usecols=lambda col: col in unit_col_candidates + days_col_candidates)
                     logger.info(f"Successfully read rentroll file with {encoding} encoding")
                     break
                 except UnicodeDecodeError:
@@ -144,10 +303,6 @@ class UnitStatusAnalyzer:
             available_cols = list(df.columns)
             missing_cols = []
             
-            # Map possible column names
-            unit_col_candidates = ['Unit', 'UNIT', '"Unit"', '"UNIT"']
-            days_col_candidates = ['Days Past Due', 'DAYS PAST DUE', '"Days Past Due"', '"DAYS PAST DUE"']
-            
             unit_col_found = any(col in available_cols for col in unit_col_candidates)
             days_col_found = any(col in available_cols for col in days_col_candidates)
             
@@ -159,8 +314,7 @@ class UnitStatusAnalyzer:
             if missing_cols:
                 raise ValueError(f"Missing required columns in rentroll.csv: {missing_cols}")
             
-            # Clean and process the data
-            df = df.copy()
+            # Clean and process the data (df was just read, so it is modified in place)
             
             # Handle different column name formats
             unit_col = None
@@ -176,14 +330,15 @@ class UnitStatusAnalyzer:
                     days_col = col
                     break
             
-            df['Unit'] = df[unit_col].astype(str).str.strip()
+            df['Unit'] = clean_unit_ids(df[unit_col])
             
             # Convert Days Past Due to numeric, handling empty values
             df['Days_Past_Due_Clean'] = pd.to_numeric(df[days_col], errors='coerce').fillna(0)
             
             # Determine payment status
-            df['Payment_Status'] = df['Days_Past_Due_Clean'].apply(
-                lambda x: 'Delinquent' if x > 0 else 'Current'
+            df['Payment_Status'] = pd.Categorical.from_codes(
+                (df['Days_Past_Due_Clean'].to_numpy() > 0).astype('int8'),
+                categories=['Current', 'Delinquent']
             )
             
             logger.info(f"Loaded {len(df)} occupied units from rentroll.csv")
@@ -206,18 +361,22 @@ class UnitStatusAnalyzer:
         try:
             logger.info(f"Loading locks file: {file_path}")
             
+            # Only the unit and status columns are used
+            usecols = lambda col: col in ('Unit Number', 'Status')
+            dtype = {'Status': 'category'}
+            
             # Check file extension to determine how to read it
             if file_path.lower().endswith('.xlsx'):
-                df = pd.read_excel(file_path)
+                df = pd.read_excel(file_path, usecols=usecols, dtype=dtype)
                 logger.info("Reading locks file as Excel format")
             else:
                 # Try different encodings for CSV files
-                encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
+                encodings = candidate_encodings(file_path)
                 df = None
                 
                 for encoding in encodings:
                     try:
-                        df = pd.read_csv(file_path, encoding=encoding)
+                        df = read_csv_fast(file_path, encoding=encoding, usecols=usecols, dtype=dtype)
                         logger.info(f"Successfully read locks file with {encoding} encoding")
                         break
                     except UnicodeDecodeError:
@@ -232,10 +391,10 @@ class UnitStatusAnalyzer:
             if missing_cols:
                 raise ValueError(f"Missing required columns in locks.csv: {missing_cols}")
             
-            # Clean and process the data
-            df = df.copy()
-            df['Unit'] = df['Unit Number'].astype(str).str.strip()
-            df['Lock_Status'] = df['Status'].astype(str).str.strip()
+            # Clean and process the data (df was just read, so it is modified in place)
+            df['Unit'] = clean_unit_ids(df['Unit Number'])
+            # Categories come from the data so unexpected statuses are kept
+            df['Lock_Status'] = df['Status'].astype(str).str.strip().astype('category')
             
             # Validate lock statuses
             invalid_statuses = df[~df['Lock_Status'].isin(self.valid_lock_statuses)]
@@ -263,40 +422,55 @@ class UnitStatusAnalyzer:
         """
         logger.info("Determining unit status...")
         
-        # Start with all units
-        result_df = units_df[['Unit', 'Unit_Status']].copy()
-        
-        # Create a mapping of units to payment status from rentroll
-        rentroll_mapping = rentroll_df.set_index('Unit')['Payment_Status'].to_dict()
-        
-        def get_final_status(row):
-            unit = row['Unit']
-            unit_status = row['Unit_Status']
-            
-            if unit_status == 'Vacant':
-                return 'Vacant'
-            elif unit_status == 'Occupied':
-                if unit in rentroll_mapping:
-                    payment_status = rentroll_mapping[unit]
-                    return f'Occupied-{payment_status}'
-                else:
-                    # Unit marked as occupied in units.csv but not in rentroll.csv
-                    # This could be a data inconsistency, but we'll treat as vacant
-                    logger.warning(f"Unit {unit} marked as occupied but not found in rentroll - treating as vacant")
-                    return 'Vacant'
-            else:
-                return 'Unknown'
-        
-        result_df['Final_Status'] = result_df.apply(get_final_status, axis=1)
+        # Start with all units; the column selection is already a new frame
+        result_df = units_df[['Unit', 'Unit_Status']]
+        
+        # Look up each unit's payment status from rentroll
+        payment_status = self._lookup_by_unit(result_df, rentroll_df, 'Payment_Status')
+        is_vacant = result_df['Unit_Status'].eq('Vacant')
+        is_occupied = result_df['Unit_Status'].eq('Occupied')
+        in_rentroll = payment_status.notna()
+        
+        # Unit marked as occupied in units.csv but not in rentroll.csv
+        # This could be a data inconsistency, but we'll treat as vacant
+        occupied_not_in_rentroll = is_occupied & ~in_rentroll
+        if occupied_not_in_rentroll.any():
+            missing_units = result_df.loc[occupied_not_in_rentroll, 'Unit'].tolist()
+            logger.warning(f"{len(missing_units)} units marked as occupied but not found in rentroll "
+                           f"- treating as vacant: {missing_units}")
+        
+        result_df['Final_Status'] = pd.Categorical(np.select(
+            [is_vacant, is_occupied & in_rentroll, occupied_not_in_rentroll],
+            ['Vacant', 'Occupied-' + payment_status.astype(str).fillna(''), 'Vacant'],
+            default='Unknown'
+        ))
         
         # Handle units in rentroll but not in units.csv (shouldn't happen but just in case)
-        units_in_rentroll_not_units = set(rentroll_df['Unit']) - set(units_df['Unit'])
-        if units_in_rentroll_not_units:
-            logger.warning(f"Units in rentroll but not in units.csv: {units_in_rentroll_not_units}")
+        units_in_rentroll_not_units = pd.Index(rentroll_df['Unit']).difference(units_df['Unit'])
+        if not units_in_rentroll_not_units.empty:
+            logger.warning(f"Units in rentroll but not in units.csv: {units_in_rentroll_not_units.tolist()}")
         
         logger.info("Unit status determination completed")
         return result_df
     
+    def _lookup_by_unit(self, units_df: pd.DataFrame, lookup_df: pd.DataFrame, column: str) -> pd.Series:
+        """
+        Look up a column of another table for each unit with a left hash join.
+        
+        When a unit appears more than once in the lookup table, its last row wins.
+        
+        Args:
+            units_df (pd.DataFrame): Units to look up, with a Unit column
+            lookup_df (pd.DataFrame): Table with Unit and the looked-up column
+            column (str): Column to take from the lookup table
+            
+        Returns:
+            pd.Series: Looked-up values aligned to units_df, NaN where not found
+        """
+        lookup = lookup_df[['Unit', column]].drop_duplicates('Unit', keep='last')
+        merged = units_df[['Unit']].merge(lookup, on='Unit', how='left', sort=False)
+        return pd.Series(merged[column].to_numpy(), index=units_df.index, name=column)
+    
     def add_lock_status(self, units_df: pd.DataFrame, locks_df: pd.DataFrame) -> pd.DataFrame:
         """
         Add lock status information to the units dataframe.
@@ -310,26 +484,26 @@ class UnitStatusAnalyzer:
         """
         logger.info("Adding lock status information...")
         
-        result_df = units_df.copy()
-        
-        # Create a mapping of units to lock status
-        locks_mapping = locks_df.set_index('Unit')['Lock_Status'].to_dict()
-        
         # Add actual lock status
-        result_df['Actual_Lock_Status'] = result_df['Unit'].map(locks_mapping).fillna('No Lock Assigned')
+        actual_lock_status = (self._lookup_by_unit(units_df, locks_df, 'Lock_Status')
+                              .astype(object)
+                              .fillna('No Lock Assigned')
+                              .astype('category'))
         
         # Determine expected lock status
-        def get_expected_lock_status(final_status):
-            if final_status == 'Vacant':
-                return 'Assigned Vacant'
-            elif final_status == 'Occupied-Current':
-                return 'Tenant Using Lock'
-            elif final_status == 'Occupied-Delinquent':
-                return 'Assigned Overlock or Assigned Auction'  # Either is acceptable
-            else:
-                return 'Unknown'
+        expected_lock_status = {
+            'Vacant': 'Assigned Vacant',
+            'Occupied-Current': 'Tenant Using Lock',
+            'Occupied-Delinquent': 'Assigned Overlock or Assigned Auction'  # Either is acceptable
+        }
+        # On a categorical this maps each category once, not every row
+        expected = (units_df['Final_Status'].astype('category')
+                    .map(lambda status: expected_lock_status.get(status, 'Unknown'))
+                    .astype('category'))
         
-        result_df['Expected_Lock_Status'] = result_df['Final_Status'].apply(get_expected_lock_status)
+        # assign shares the existing columns instead of copying the frame
+        result_df = units_df.assign(Actual_Lock_Status=actual_lock_status,
+                                    Expected_Lock_Status=expected)
         
         logger.info("Lock status information added")
         return result_df
@@ -346,52 +520,100 @@ class UnitStatusAnalyzer:
         """
         logger.info("Detecting miscompares...")
         
-        result_df = df.copy()
+        # Both flags depend only on the (Final_Status, Actual_Lock_Status)
+        # pair: map each category to its lookup-table slot, then gather each
+        # row's result by its category codes
+        final_slot = self._lut_slots(df['Final_Status'], list(self.expected_lock_status))
+        lock_slot = self._lut_slots(df['Actual_Lock_Status'], self.valid_lock_statuses)
         
-        def is_miscompare(row):
-            actual = row['Actual_Lock_Status']
-            expected = row['Expected_Lock_Status']
-            final_status = row['Final_Status']
-            
-            # Handle special case for delinquent units
-            if final_status == 'Occupied-Delinquent':
-                return actual not in ['Assigned Overlock', 'Assigned Auction']
-            
-            # Handle other cases
-            if final_status == 'Vacant':
-                return actual != 'Assigned Vacant'
-            elif final_status == 'Occupied-Current':
-                return actual != 'Tenant Using Lock'
-            else:
-                return False
+        is_miscompare = self._miscompare_lut[final_slot, lock_slot]
+        severity = pd.Categorical.from_codes(self._severity_lut[final_slot, lock_slot],
+                                             categories=self._severity_labels).remove_unused_categories()
         
-        result_df['Is_Miscompare'] = result_df.apply(is_miscompare, axis=1)
-        
-        # Add miscompare severity
-        def get_miscompare_severity(row):
-            if not row['Is_Miscompare']:
-                return 'No Issue'
-            
-            actual = row['Actual_Lock_Status']
-            final_status = row['Final_Status']
-            
-            # High severity miscompares
-            if final_status == 'Vacant' and actual in ['Tenant Using Lock', 'Assigned Overlock']:
-                return 'HIGH - Vacant unit with tenant lock'
-            elif final_status == 'Occupied-Current' and actual in ['Assigned Vacant', 'Assigned Overlock']:
-                return 'HIGH - Current tenant without proper lock'
-            elif final_status == 'Occupied-Delinquent' and actual == 'Assigned Vacant':
-                return 'HIGH - Delinquent unit without lock'
-            else:
-                return 'MEDIUM - Lock status mismatch'
-        
-        result_df['Miscompare_Severity'] = result_df.apply(get_miscompare_severity, axis=1)
+        # assign shares the existing columns instead of copying the frame
+        result_df = df.assign(Is_Miscompare=is_miscompare, Miscompare_Severity=severity)
         
         miscompare_count = result_df['Is_Miscompare'].sum()
         logger.info(f"Detected {miscompare_count} miscompares out of {len(result_df)} units")
         
         return result_df
     
+    def _lut_slots(self, series: pd.Series, known_values: List[str]) -> np.ndarray:
+        """
+        Map each value to its lookup-table slot via its category code.
+        
+        Args:
+            series (pd.Series): Status column
+            known_values (List[str]): Values with their own slot, in slot order
+            
+        Returns:
+            np.ndarray: Slot per row; any other or missing value gets the last slot
+        """
+        categorical = series.astype('category')
+        other = len(known_values)
+        slots = pd.Index(known_values).get_indexer(categorical.cat.categories)
+        slots = np.append(np.where(slots < 0, other, slots), other)
+        # Code -1 (missing) picks the trailing "other" entry
+        return slots[categorical.cat.codes.to_numpy()]
+    
+    def _classify_lock_status(self, final_status: pd.Series, actual: pd.Series) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Flag miscompares and grade their severity for paired status values.
+        
+        Args:
+            final_status (pd.Series): Final unit status of each pair
+            actual (pd.Series): Actual lock status of each pair
+            
+        Returns:
+            Tuple[np.ndarray, np.ndarray]: Miscompare flags and severity labels
+        """
+        is_vacant = final_status.eq('Vacant')
+        is_current = final_status.eq('Occupied-Current')
+        is_delinquent = final_status.eq('Occupied-Delinquent')
+        
+        # Delinquent units accept either overlock or auction; other statuses
+        # (e.g. Unknown) are never flagged
+        is_miscompare = ((is_vacant & actual.ne('Assigned Vacant')) |
+                         (is_current & actual.ne('Tenant Using Lock')) |
+                         (is_delinquent & ~actual.isin(['Assigned Overlock', 'Assigned Auction'])))
+        
+        # Conditions are checked in order
+        severity = np.select(
+            [
+                ~is_miscompare,
+                is_vacant & actual.isin(['Tenant Using Lock', 'Assigned Overlock']),
+                is_current & actual.isin(['Assigned Vacant', 'Assigned Overlock']),
+                is_delinquent & actual.eq('Assigned Vacant'),
+            ],
+            [
+                SEVERITY_NONE,
+                SEVERITY_HIGH_VACANT,
+                SEVERITY_HIGH_CURRENT,
+                SEVERITY_HIGH_DELINQUENT,
+            ],
+            default=SEVERITY_MEDIUM
+        )
+        
+        return is_miscompare.to_numpy(dtype=bool), severity
+    
+    def _count_values(self, series: pd.Series) -> Dict:
+        """
+        Count each distinct value with a histogram over its category codes.
+        
+        Args:
+            series (pd.Series): Column to count
+            
+        Returns:
+            Dict: Value to count, most frequent first, missing values excluded
+        """
+        categorical = series.astype('category')
+        codes = categorical.cat.codes.to_numpy()
+        counts = np.bincount(codes[codes >= 0], minlength=len(categorical.cat.categories))
+        
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        return dict(zip(categorical.cat.categories[order].tolist(), counts[order].tolist()))
+    
     def generate_summary_report(self, df: pd.DataFrame) -> Dict:
         """
         Generate a summary report of the analysis.
@@ -404,14 +626,19 @@ class UnitStatusAnalyzer:
         """
         logger.info("Generating summary report...")
         
+        miscompare_count = int(df['Is_Miscompare'].to_numpy().sum())
         summary = {
             'total_units': len(df),
-            'unit_status_breakdown': df['Final_Status'].value_counts().to_dict(),
-            'lock_status_breakdown': df['Actual_Lock_Status'].value_counts().to_dict(),
-            'miscompare_count': df['Is_Miscompare'].sum(),
-            'miscompare_rate': (df['Is_Miscompare'].sum() / len(df)) * 100,
-            'severity_breakdown': df['Miscompare_Severity'].value_counts().to_dict()
+            'unit_status_breakdown': self._count_values(df['Final_Status']),
+            'lock_status_breakdown': self._count_values(df['Actual_Lock_Status']),
+            'miscompare_count': miscompare_count,
+            'miscompare_rate': (miscompare_count / len(df)) * 100,
+            'severity_breakdown': self._count_values(df['Miscompare_Severity'])
         }
+        summary['high_severity_total'] = sum(
+            count for severity, count in summary['severity_breakdown'].items()
+            if severity.startswith('HIGH')
+        )
         
         return summary
     
@@ -467,7 +694,16 @@ class UnitStatusAnalyzer:
         
         logger.info(f"Saving results to {output_file}")
         
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
+        # xlsxwriter serializes values-only sheets much faster than openpyxl.
+        # constant_memory is not enabled: pandas writes cells column by column,
+        # and that mode drops anything not written row by row.
+        if importlib.util.find_spec('xlsxwriter') is not None:
+            writer_args = {'engine': 'xlsxwriter',
+                           'engine_kwargs': {'options': {'strings_to_urls': False}}}
+        else:
+            writer_args = {'engine': 'openpyxl'}
+        
+        with pd.ExcelWriter(output_file, **writer_args) as writer:
             # Main results
             self.master_df.to_excel(writer, sheet_name='Unit_Analysis', index=False)
             
@@ -484,6 +720,23 @@ class UnitStatusAnalyzer:
         
         logger.info("Results saved successfully")
     
+    def save_results_parquet(self, output_file: str):
+        """
+        Save analysis results to a zstd-compressed Parquet file.
+        
+        Much smaller and faster to write than Excel; categorical columns are
+        stored dictionary-encoded and read back as categoricals.
+        
+        Args:
+            output_file (str or file-like): Path or binary file object to write to
+        """
+        if self.master_df is None:
+            raise ValueError("No analysis results to save. Run analysis first.")
+        
+        logger.info(f"Saving results to {output_file}")
+        self.master_df.to_parquet(output_file, index=False, compression='zstd')
+        logger.info("Results saved successfully")
+    
     def get_miscompares(self) -> pd.DataFrame:
         """
         Get only the units with miscompares.
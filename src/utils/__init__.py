@@ -2,16 +2,22 @@
 Utility functions for the data science project
 """
 
-from .data_utils import load_data, save_data, clean_data
-from .plot_utils import create_plots, save_plots
-from .model_utils import train_model, evaluate_model
+from .file_utils import find_missing_files
+
+# The data helpers need pandas, so data_utils is only imported when one of
+# them is first used (PEP 562); the CLI scripts import find_missing_files
+# before deciding whether pandas is needed at all
+_DATA_UTILS = ('load_data', 'save_data', 'clean_data')
+
+def __getattr__(name):
+    if name in _DATA_UTILS:
+        from . import data_utils
+        return getattr(data_utils, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'load_data',
-    'save_data', 
+    'save_data',
     'clean_data',
-    'create_plots',
-    'save_plots',
-    'train_model',
-    'evaluate_model'
+    'find_missing_files'
 ]
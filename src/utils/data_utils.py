@@ -117,24 +117,25 @@ def clean_data(df, missing_strategy='drop', outlier_method='iqr'):
         numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
         df_clean[numeric_cols] = df_clean[numeric_cols].fillna(df_clean[numeric_cols].median())
     elif missing_strategy == 'mode':
-        for col in df_clean.columns:
-            df_clean[col] = df_clean[col].fillna(df_clean[col].mode()[0] if not df_clean[col].mode().empty else df_clean[col].iloc[0])
+        # First row of DataFrame.mode() is each column's (smallest) mode; it is
+        # NaN only for all-missing columns, which have nothing to fill from
+        if not df_clean.empty:
+            df_clean = df_clean.fillna(df_clean.mode().iloc[0])
     
-    # Handle outliers
+    # Handle outliers: bounds for every numeric column are computed on the
+    # same rows, and one combined mask drops any row outside them
+    numeric = df_clean.select_dtypes(include=[np.number])
     if outlier_method == 'iqr':
-        numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            Q1 = df_clean[col].quantile(0.25)
-            Q3 = df_clean[col].quantile(0.75)
-            IQR = Q3 - Q1
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            df_clean = df_clean[(df_clean[col] >= lower_bound) & (df_clean[col] <= upper_bound)]
+        quartiles = numeric.quantile([0.25, 0.75])
+        Q1 = quartiles.loc[0.25]
+        Q3 = quartiles.loc[0.75]
+        IQR = Q3 - Q1
+        lower_bound = Q1 - 1.5 * IQR
+        upper_bound = Q3 + 1.5 * IQR
+        df_clean = df_clean[(numeric.ge(lower_bound) & numeric.le(upper_bound)).all(axis=1)]
     elif outlier_method == 'zscore':
-        numeric_cols = df_clean.select_dtypes(include=[np.number]).columns
-        for col in numeric_cols:
-            z_scores = np.abs((df_clean[col] - df_clean[col].mean()) / df_clean[col].std())
-            df_clean = df_clean[z_scores < 3]
+        z_scores = (numeric - numeric.mean()).abs() / numeric.std()
+        df_clean = df_clean[(z_scores < 3).all(axis=1)]
     
     logger.info(f"Data cleaning completed. Shape changed from {df.shape} to {df_clean.shape}")
     
@@ -0,0 +1,42 @@
+"""
+File system utility functions
+"""
+
+import os
+from collections import defaultdict
+from pathlib import Path
+
+def find_missing_files(file_paths) -> list:
+    """
+    Return the paths that do not exist as files.
+
+    Paths are grouped by parent directory and each directory is listed once
+    with os.scandir, instead of issuing a stat() per file. Names not found
+    in a listing are re-checked with os.path.isfile, so case-insensitive
+    filesystems (Windows, macOS) accept a differently-cased name as before.
+
+    Parameters:
+    -----------
+    file_paths : iterable of str or Path
+        Paths to check
+
+    Returns:
+    --------
+    list
+        The given paths that are missing, in input order
+    """
+    file_paths = list(file_paths)
+    by_parent = defaultdict(set)
+    for file_path in file_paths:
+        path = Path(file_path)
+        by_parent[path.parent].add(path.name)
+
+    present = set()
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                present.update(parent / e.name for e in it if e.name in names and e.is_file())
+        except OSError:
+            continue
+    return [file_path for file_path in file_paths
+            if Path(file_path) not in present and not os.path.isfile(file_path)]
@@ -7,16 +7,23 @@ Users can upload CSV files and receive comprehensive analysis reports.
 
 import streamlit as st
 import pandas as pd
+import openpyxl
 import io
-import base64
+import csv
+import importlib.util
+import codecs
 from datetime import datetime
 import logging
 from pathlib import Path
 import tempfile
 import os
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 
 # Import our custom modules
-from src.unit_status_analyzer import UnitStatusAnalyzer
+from src.unit_status_analyzer import (
+    UnitStatusAnalyzer, sample_encodings, SEVERITY_HIGH_VACANT, SEVERITY_MEDIUM
+)
 from src.report_generator import ReportGenerator
 from src.enhanced_excel_exporter import EnhancedExcelExporter
 
@@ -78,67 +85,203 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
-def create_download_link(data, filename, file_type="text/csv"):
-    """Create a download link for data."""
-    href = ""  # Initialize href variable
+XLSX_MIME = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+# Complete-results download formats: name -> (extension, MIME type). Parquet
+# is offered first when pyarrow is installed to write it.
+RESULTS_FORMATS = {"CSV": (".csv", "text/csv")}
+if importlib.util.find_spec("pyarrow") is not None:
+    RESULTS_FORMATS = {"Parquet": (".parquet", "application/vnd.apache.parquet"), **RESULTS_FORMATS}
+
+def download_button(data, filename, mime):
+    """Render a download button for report bytes.
+    
+    on_click="ignore" keeps the click from rerunning the script, so the
+    results stay on screen after a download.
+    """
+    st.download_button(
+        label=f"Download {filename}",
+        data=data,
+        file_name=filename,
+        mime=mime,
+        on_click="ignore"
+    )
+
+def read_upload_header(data, is_excel):
+    """Read the header row and data row count of uploaded CSV or Excel bytes.
+    
+    Only the header is parsed; rows are counted without parsing them (physical
+    lines for CSV, the worksheet dimensions for Excel).
+    """
+    if is_excel:
+        workbook = openpyxl.load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+        try:
+            worksheet = workbook.worksheets[0]
+            header = next(worksheet.iter_rows(max_row=1, values_only=True), ())
+            row_count = max((worksheet.max_row or 1) - 1, 0)
+        finally:
+            workbook.close()
+        return [str(col) for col in header if col is not None], row_count
     
-    if file_type == "text/csv":
-        csv = data.to_csv(index=False)
-        b64 = base64.b64encode(csv.encode()).decode()
-        href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">Download {filename}</a>'
-    elif file_type == "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet":
-        b64 = base64.b64encode(data).decode()
-        href = f'<a href="data:application/vnd.openxmlformats-officedocument.spreadsheetml.sheet;base64,{b64}" download="{filename}">Download {filename}</a>'
-    elif file_type == "text/html":
-        b64 = base64.b64encode(data).decode()
-        href = f'<a href="data:text/html;base64,{b64}" download="{filename}">Download {filename}</a>'
-    elif file_type == "application/zip":
-        b64 = base64.b64encode(data).decode()
-        href = f'<a href="data:application/zip;base64,{b64}" download="{filename}">Download {filename}</a>'
+    # Sniff the encoding from a sample so the file is normally decoded once;
+    # the others are only tried if a later byte disagrees
+    sample = data[:65536]
+    if sample.startswith(codecs.BOM_UTF8):
+        encodings = ['utf-8-sig']
     else:
-        # Fallback for unknown file types
-        href = f'<span style="color: red;">Unsupported file type: {file_type}</span>'
+        encodings = sample_encodings(sample)
     
-    return href
+    for encoding in encodings:
+        text = io.TextIOWrapper(io.BytesIO(data), encoding=encoding, newline='')
+        try:
+            # Skip leading blank lines, as pd.read_csv does
+            header = next((row for row in csv.reader(text) if row), [])
+            row_count = sum(1 for line in text if line.strip())
+        except UnicodeDecodeError:
+            continue
+        return header, row_count
+    
+    raise ValueError("Could not read CSV file with any supported encoding")
 
-def validate_csv_file(file, expected_columns, file_name):
-    """Validate uploaded CSV or Excel file."""
+def validate_csv_file(data, upload_name, expected_columns, file_name):
+    """Validate the header of an uploaded CSV or Excel file from its bytes."""
+    is_excel = upload_name.lower().endswith('.xlsx')
     try:
-        # Check file extension to determine how to read it
-        if file.name.lower().endswith('.xlsx'):
-            df = pd.read_excel(file)
-        else:
-            # Try different encodings for CSV files
-            encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
-            df = None
-            
-            for encoding in encodings:
-                try:
-                    file.seek(0)  # Reset file pointer
-                    df = pd.read_csv(file, encoding=encoding)
-                    break
-                except UnicodeDecodeError:
-                    continue
-            
-            if df is None:
-                raise ValueError("Could not read CSV file with any supported encoding")
+        columns, row_count = read_upload_header(data, is_excel)
         
-        available_cols = [col.strip().strip('"') for col in df.columns]
+        # Lower-cased once; exact names are a set lookup, and only columns
+        # without an exact match fall back to the substring scan
+        available_cols = {col.strip().strip('"').lower() for col in columns}
         
         missing_cols = []
         for expected_col in expected_columns:
-            if not any(expected_col.lower() in col.lower() for col in available_cols):
+            expected_lower = expected_col.lower()
+            if expected_lower in available_cols:
+                continue
+            if not any(expected_lower in col for col in available_cols):
                 missing_cols.append(expected_col)
         
         if missing_cols:
             return False, f"Missing required columns in {file_name}: {missing_cols}"
         
-        file_type = "Excel" if file.name.lower().endswith('.xlsx') else "CSV"
-        return True, f"✅ {file_name} ({file_type}) validated successfully ({len(df)} rows)"
+        file_type = "Excel" if is_excel else "CSV"
+        return True, f"✅ {file_name} ({file_type}) validated successfully ({row_count} rows)"
     
     except Exception as e:
         return False, f"Error reading {file_name}: {str(e)}"
 
+@st.cache_data(show_spinner=False)
+def sample_input_frames():
+    """Build the sample input tables shown with the instructions (once per server)."""
+    sample_units = pd.DataFrame({
+        'Unit': ['A001', 'A002', 'A003'],
+        'Status': ['Occupied - Current', 'Vacant - Available', 'Occupied - Delinquent']
+    })
+    sample_rentroll = pd.DataFrame({
+        'Unit': ['A001', 'A003'],
+        'Days Past Due': [0, 15]
+    })
+    sample_locks = pd.DataFrame({
+        'Unit Number': ['A001', 'A002', 'A003'],
+        'Status': ['Tenant Using Lock', 'Assigned Vacant', 'Assigned Overlock']
+    })
+    return sample_units, sample_rentroll, sample_locks
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def run_full_pipeline(units_bytes: bytes, rentroll_bytes: bytes, locks_bytes: bytes,
+                      locks_ext: str, flags: tuple, results_format: str = "CSV") -> dict:
+    """Run the analysis and build every report for the uploaded files.
+    
+    Cached on the file contents and option flags, so Streamlit reruns with
+    the same inputs return the stored results instead of recomputing them.
+    
+    Args:
+        units_bytes: Contents of the units CSV
+        rentroll_bytes: Contents of the rentroll CSV
+        locks_bytes: Contents of the locks CSV or Excel file
+        locks_ext: Extension of the locks upload ('.csv' or '.xlsx')
+        flags: (include_dashboard, include_visualizations, include_enhanced_excel)
+        results_format: Format of the complete results download ('Parquet' or 'CSV')
+    
+    Returns:
+        dict: results_df, summary, alert_df and the report/CSV files as bytes
+            (None for reports that were not requested)
+    """
+    include_dashboard, include_visualizations, include_enhanced_excel = flags
+    analyzer = UnitStatusAnalyzer()
+    pipeline = {'enhanced_xlsx': None, 'dashboard_html': None, 'viz_zip': None}
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        temp_dir = Path(temp_dir)
+        temp_units = temp_dir / 'units.csv'
+        temp_rentroll = temp_dir / 'rentroll.csv'
+        temp_locks = temp_dir / ('locks.xlsx' if locks_ext == '.xlsx' else 'locks.csv')
+        temp_units.write_bytes(units_bytes)
+        temp_rentroll.write_bytes(rentroll_bytes)
+        temp_locks.write_bytes(locks_bytes)
+        
+        results_df = analyzer.run_analysis(str(temp_units), str(temp_rentroll), str(temp_locks))
+        pipeline['results_df'] = results_df
+        pipeline['summary'] = analyzer.generate_summary_report(results_df)
+        
+        report_gen = ReportGenerator(results_df)
+        
+        if include_visualizations:
+            # Charts are drawn on this thread with pyplot, which keeps global
+            # figure state, so they stay out of the report writer pool below
+            viz_dir = temp_dir / 'visualizations'
+            viz_dir.mkdir(exist_ok=True)
+            viz_files = report_gen.create_visualizations(str(viz_dir))
+        
+        # The report writers only share results_df, so they run side by side
+        # and the pipeline waits for the slowest one instead of all of them
+        # Reports are written straight into memory buffers; only the charts
+        # and the uploads go through the temp directory
+        report_buffers = {'standard_xlsx': io.BytesIO()}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [executor.submit(report_gen.create_detailed_report,
+                                       report_buffers['standard_xlsx'])]
+            
+            if include_enhanced_excel:
+                report_buffers['enhanced_xlsx'] = io.BytesIO()
+                futures.append(executor.submit(EnhancedExcelExporter().create_enhanced_report,
+                                               results_df, report_buffers['enhanced_xlsx']))
+            
+            if include_dashboard:
+                report_buffers['dashboard_html'] = io.BytesIO()
+                futures.append(executor.submit(report_gen.create_summary_dashboard,
+                                               report_buffers['dashboard_html']))
+            
+            pipeline['alert_df'] = report_gen.generate_alert_report()
+            
+            # Serialized once here so downloads hand Streamlit ready-made bytes;
+            # only the requested format is built for the complete results
+            results_file = io.BytesIO()
+            if results_format == "Parquet":
+                analyzer.save_results_parquet(results_file)
+            else:
+                results_df.to_csv(results_file, index=False)
+            pipeline['results_file'] = results_file.getvalue()
+            pipeline['alert_csv'] = pipeline['alert_df'].to_csv(index=False).encode()
+            
+            # Re-raise the first failure, if any
+            for future in futures:
+                future.result()
+        
+        for key, buffer in report_buffers.items():
+            pipeline[key] = buffer.getvalue()
+        
+        if include_visualizations:
+            # Zip the charts in memory; PNGs are already compressed, so they
+            # are stored rather than deflated
+            viz_zip = io.BytesIO()
+            with zipfile.ZipFile(viz_zip, 'w', zipfile.ZIP_STORED) as zipf:
+                for viz_file in viz_files:
+                    zipf.write(viz_file, os.path.basename(viz_file))
+            pipeline['viz_zip'] = viz_zip.getvalue()
+    
+    return pipeline
+
 def main():
     """Main Streamlit application."""
     
@@ -183,6 +326,11 @@ def main():
         include_dashboard = st.checkbox("Generate Interactive Dashboard", value=True)
         include_visualizations = st.checkbox("Generate Individual Visualizations", value=True)
         include_enhanced_excel = st.checkbox("Generate Enhanced Excel Report", value=True)
+        results_format = st.radio(
+            "Complete Results Format",
+            RESULTS_FORMATS,
+            help="Parquet is much smaller than CSV and keeps column types (needs pyarrow to read back)."
+        )
         
         st.markdown("---")
         st.header("ℹ️ About")
@@ -207,24 +355,29 @@ def main():
         # Validate files
         st.markdown('<h2 class="sub-header">📋 File Validation</h2>', unsafe_allow_html=True)
         
+        # Each upload's bytes are taken once and shared by validation and analysis
+        units_bytes = units_file.getvalue()
+        rentroll_bytes = rentroll_file.getvalue()
+        locks_bytes = locks_file.getvalue()
+        
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            valid_units, msg_units = validate_csv_file(units_file, ['Unit', 'Status'], 'units.csv')
+            valid_units, msg_units = validate_csv_file(units_bytes, units_file.name, ['Unit', 'Status'], 'units.csv')
             if valid_units:
                 st.success(msg_units)
             else:
                 st.error(msg_units)
         
         with col2:
-            valid_rentroll, msg_rentroll = validate_csv_file(rentroll_file, ['Unit', 'Days Past Due'], 'rentroll.csv')
+            valid_rentroll, msg_rentroll = validate_csv_file(rentroll_bytes, rentroll_file.name, ['Unit', 'Days Past Due'], 'rentroll.csv')
             if valid_rentroll:
                 st.success(msg_rentroll)
             else:
                 st.error(msg_rentroll)
         
         with col3:
-            valid_locks, msg_locks = validate_csv_file(locks_file, ['Unit Number', 'Status'], 'locks.csv')
+            valid_locks, msg_locks = validate_csv_file(locks_bytes, locks_file.name, ['Unit Number', 'Status'], 'locks.csv')
             if valid_locks:
                 st.success(msg_locks)
             else:
@@ -240,205 +393,108 @@ def main():
                 status_text = st.empty()
                 
                 try:
-                    # Initialize analyzer
-                    status_text.text("Initializing analyzer...")
-                    progress_bar.progress(10)
+                    status_text.text("Running analysis and generating reports...")
+                    progress_bar.progress(20)
                     
-                    analyzer = UnitStatusAnalyzer()
+                    # Identical uploads and options are served from the cache
+                    pipeline = run_full_pipeline(
+                        units_bytes,
+                        rentroll_bytes,
+                        locks_bytes,
+                        Path(locks_file.name).suffix.lower(),
+                        (include_dashboard, include_visualizations, include_enhanced_excel),
+                        results_format
+                    )
+                    results_df = pipeline['results_df']
+                    summary = pipeline['summary']
+                    alert_report = pipeline['alert_df']
+                    standard_excel_data = pipeline['standard_xlsx']
+                    enhanced_excel_data = pipeline['enhanced_xlsx']
+                    dashboard_data = pipeline['dashboard_html']
+                    viz_zip_data = pipeline['viz_zip']
                     
-                    # Save uploaded files temporarily
-                    status_text.text("Processing uploaded files...")
-                    progress_bar.progress(20)
+                    # Create timestamped names for downloads
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                     
-                    with tempfile.TemporaryDirectory() as temp_dir:
-                        temp_units = os.path.join(temp_dir, 'units.csv')
-                        temp_rentroll = os.path.join(temp_dir, 'rentroll.csv')
-                        temp_locks = os.path.join(temp_dir, 'locks.csv')
-                        
-                        # Save files
-                        units_file.seek(0)
-                        with open(temp_units, 'wb') as f:
-                            f.write(units_file.getbuffer())
-                        
-                        rentroll_file.seek(0)
-                        with open(temp_rentroll, 'wb') as f:
-                            f.write(rentroll_file.getbuffer())
-                        
-                        locks_file.seek(0)
-                        # Handle Excel files for locks
-                        if locks_file.name.lower().endswith('.xlsx'):
-                            temp_locks = os.path.join(temp_dir, 'locks.xlsx')
-                        with open(temp_locks, 'wb') as f:
-                            f.write(locks_file.getbuffer())
-                        
-                        # Run analysis
-                        status_text.text("Running unit status analysis...")
-                        progress_bar.progress(40)
-                        
-                        results_df = analyzer.run_analysis(temp_units, temp_rentroll, temp_locks)
-                        
-                        # Generate summary
-                        status_text.text("Generating summary report...")
-                        progress_bar.progress(60)
-                        
-                        summary = analyzer.generate_summary_report(results_df)
-                        
-                        # Generate reports
-                        status_text.text("Generating reports...")
-                        progress_bar.progress(80)
-                        
-                        report_gen = ReportGenerator(results_df)
+                    progress_bar.progress(100)
+                    status_text.text("Analysis complete!")
+                    
+                    # Display results
+                    st.markdown('<h2 class="sub-header">📊 Analysis Results</h2>', unsafe_allow_html=True)
+                    
+                    # Summary metrics
+                    col1, col2, col3, col4 = st.columns(4)
+                    
+                    with col1:
+                        st.metric("Total Units", summary['total_units'])
+                    
+                    with col2:
+                        st.metric("Miscompares", f"{summary['miscompare_count']} ({summary['miscompare_rate']:.1f}%)")
+                    
+                    with col3:
+                        high_severity = summary['severity_breakdown'].get(SEVERITY_HIGH_VACANT, 0)
+                        st.metric("High Severity", high_severity)
+                    
+                    with col4:
+                        medium_severity = summary['severity_breakdown'].get(SEVERITY_MEDIUM, 0)
+                        st.metric("Medium Severity", medium_severity)
+                    
+                    # Status breakdown
+                    st.markdown('<h3 class="sub-header">📈 Unit Status Breakdown</h3>', unsafe_allow_html=True)
+                    
+                    # Reuse the counts generate_summary_report already made
+                    status_breakdown = pd.Series(summary['unit_status_breakdown'], name='Count')
+                    col1, col2 = st.columns([1, 2])
+                    
+                    with col1:
+                        st.dataframe(status_breakdown.rename_axis('Status').reset_index())
+                    
+                    with col2:
+                        st.bar_chart(status_breakdown)
+                    
+                    # Miscompares table
+                    miscompares = results_df.loc[results_df['Is_Miscompare'].to_numpy(dtype=bool)]
+                    if not miscompares.empty:
+                        st.markdown('<h3 class="sub-header">⚠️ Miscompares Found</h3>', unsafe_allow_html=True)
                         
-                        # Create temporary files for downloads
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                        miscompares_display = miscompares[['Unit', 'Final_Status', 'Actual_Lock_Status', 'Expected_Lock_Status', 'Miscompare_Severity']]
                         
-                        # Generate Excel reports
+                        st.dataframe(miscompares_display, use_container_width=True)
+                    
+                    # Download section
+                    st.markdown('<h3 class="sub-header">📥 Download Reports</h3>', unsafe_allow_html=True)
+                    
+                    download_col1, download_col2 = st.columns(2)
+                    
+                    with download_col1:
+                        st.markdown("**Excel Reports:**")
                         if include_enhanced_excel:
-                            enhanced_excel_path = os.path.join(temp_dir, f'enhanced_analysis_{timestamp}.xlsx')
-                            enhanced_exporter = EnhancedExcelExporter()
-                            enhanced_exporter.create_enhanced_report(results_df, enhanced_excel_path)
-                            
-                            with open(enhanced_excel_path, 'rb') as f:
-                                enhanced_excel_data = f.read()
-                        
-                        standard_excel_path = os.path.join(temp_dir, f'standard_analysis_{timestamp}.xlsx')
-                        report_gen.create_detailed_report(standard_excel_path)
+                            download_button(enhanced_excel_data, f'enhanced_analysis_{timestamp}.xlsx', XLSX_MIME)
                         
-                        with open(standard_excel_path, 'rb') as f:
-                            standard_excel_data = f.read()
-                        
-                        # Generate CSV
-                        csv_data = results_df.to_csv(index=False)
+                        download_button(standard_excel_data, f'standard_analysis_{timestamp}.xlsx', XLSX_MIME)
+                        extension, mime = RESULTS_FORMATS[results_format]
+                        download_button(pipeline['results_file'], f'complete_results_{timestamp}{extension}', mime)
+                    
+                    with download_col2:
+                        st.markdown("**Additional Reports:**")
                         
-                        # Generate priority alerts
-                        alert_report = report_gen.generate_alert_report()
-                        alert_csv = alert_report.to_csv(index=False) if not alert_report.empty else ""
+                        if not alert_report.empty:
+                            download_button(pipeline['alert_csv'], f'priority_alerts_{timestamp}.csv', "text/csv")
                         
-                        # Generate dashboard
                         if include_dashboard:
-                            dashboard_path = os.path.join(temp_dir, f'dashboard_{timestamp}.html')
-                            report_gen.create_summary_dashboard(dashboard_path)
-                            
-                            with open(dashboard_path, 'rb') as f:
-                                dashboard_data = f.read()
+                            download_button(dashboard_data, f'dashboard_{timestamp}.html', "text/html")
                         
-                        # Generate visualizations
                         if include_visualizations:
-                            viz_dir = os.path.join(temp_dir, 'visualizations')
-                            os.makedirs(viz_dir, exist_ok=True)
-                            report_gen.create_visualizations(viz_dir)
-                            
-                            # Create zip file of visualizations
-                            import zipfile
-                            viz_zip_path = os.path.join(temp_dir, f'visualizations_{timestamp}.zip')
-                            with zipfile.ZipFile(viz_zip_path, 'w') as zipf:
-                                for root, dirs, files in os.walk(viz_dir):
-                                    for file in files:
-                                        zipf.write(os.path.join(root, file), file)
-                            
-                            with open(viz_zip_path, 'rb') as f:
-                                viz_zip_data = f.read()
-                        
-                        progress_bar.progress(100)
-                        status_text.text("Analysis complete!")
-                        
-                        # Display results
-                        st.markdown('<h2 class="sub-header">📊 Analysis Results</h2>', unsafe_allow_html=True)
-                        
-                        # Summary metrics
-                        col1, col2, col3, col4 = st.columns(4)
-                        
-                        with col1:
-                            st.metric("Total Units", summary['total_units'])
-                        
-                        with col2:
-                            st.metric("Miscompares", f"{summary['miscompare_count']} ({summary['miscompare_rate']:.1f}%)")
-                        
-                        with col3:
-                            high_severity = summary['severity_breakdown'].get('HIGH - Vacant unit with tenant lock', 0)
-                            st.metric("High Severity", high_severity)
-                        
-                        with col4:
-                            medium_severity = summary['severity_breakdown'].get('MEDIUM - Lock status mismatch', 0)
-                            st.metric("Medium Severity", medium_severity)
-                        
-                        # Status breakdown
-                        st.markdown('<h3 class="sub-header">📈 Unit Status Breakdown</h3>', unsafe_allow_html=True)
-                        
-                        status_breakdown = results_df['Final_Status'].value_counts()
-                        col1, col2 = st.columns([1, 2])
-                        
-                        with col1:
-                            st.dataframe(status_breakdown.reset_index().rename(columns={'index': 'Status', 'Final_Status': 'Count'}))
-                        
-                        with col2:
-                            st.bar_chart(status_breakdown)
-                        
-                        # Miscompares table
-                        if not results_df[results_df['Is_Miscompare'] == True].empty:
-                            st.markdown('<h3 class="sub-header">⚠️ Miscompares Found</h3>', unsafe_allow_html=True)
-                            
-                            miscompares = results_df[results_df['Is_Miscompare'] == True].copy()
-                            miscompares_display = miscompares[['Unit', 'Final_Status', 'Actual_Lock_Status', 'Expected_Lock_Status', 'Miscompare_Severity']]
-                            
-                            st.dataframe(miscompares_display, use_container_width=True)
-                        
-                        # Download section
-                        st.markdown('<h3 class="sub-header">📥 Download Reports</h3>', unsafe_allow_html=True)
-                        
-                        download_col1, download_col2 = st.columns(2)
-                        
-                        with download_col1:
-                            st.markdown("**Excel Reports:**")
-                            if include_enhanced_excel:
-                                st.markdown(create_download_link(
-                                    enhanced_excel_data, 
-                                    f'enhanced_analysis_{timestamp}.xlsx',
-                                    "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                                ), unsafe_allow_html=True)
-                            
-                            st.markdown(create_download_link(
-                                standard_excel_data,
-                                f'standard_analysis_{timestamp}.xlsx', 
-                                "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                            ), unsafe_allow_html=True)
-                            
-                            st.markdown(create_download_link(
-                                results_df,
-                                f'complete_results_{timestamp}.csv'
-                            ), unsafe_allow_html=True)
-                        
-                        with download_col2:
-                            st.markdown("**Additional Reports:**")
-                            
-                            if not alert_report.empty:
-                                st.markdown(create_download_link(
-                                    alert_report,
-                                    f'priority_alerts_{timestamp}.csv'
-                                ), unsafe_allow_html=True)
-                            
-                            if include_dashboard:
-                                st.markdown(create_download_link(
-                                    dashboard_data,
-                                    f'dashboard_{timestamp}.html',
-                                    "text/html"
-                                ), unsafe_allow_html=True)
-                            
-                            if include_visualizations:
-                                st.markdown(create_download_link(
-                                    viz_zip_data,
-                                    f'visualizations_{timestamp}.zip',
-                                    "application/zip"
-                                ), unsafe_allow_html=True)
-                        
-                        # Success message
-                        st.markdown("""
-                        <div class="success-message">
-                            <h4>✅ Analysis Complete!</h4>
-                            <p>Your analysis has been completed successfully. Download the reports above to view detailed results, charts, and recommendations.</p>
-                        </div>
-                        """, unsafe_allow_html=True)
-                
+                            download_button(viz_zip_data, f'visualizations_{timestamp}.zip', "application/zip")
+                    
+                    # Success message
+                    st.markdown("""
+                    <div class="success-message">
+                        <h4>✅ Analysis Complete!</h4>
+                        <p>Your analysis has been completed successfully. Download the reports above to view detailed results, charts, and recommendations.</p>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
                 except Exception as e:
                     st.markdown(f"""
                     <div class="error-message">
@@ -493,25 +549,15 @@ def main():
         
         # Sample data section
         with st.expander("📊 View Sample Data Structure"):
+            sample_units, sample_rentroll, sample_locks = sample_input_frames()
+            
             st.markdown("**Sample Units CSV:**")
-            sample_units = pd.DataFrame({
-                'Unit': ['A001', 'A002', 'A003'],
-                'Status': ['Occupied - Current', 'Vacant - Available', 'Occupied - Delinquent']
-            })
             st.dataframe(sample_units)
             
             st.markdown("**Sample Rentroll CSV:**")
-            sample_rentroll = pd.DataFrame({
-                'Unit': ['A001', 'A003'],
-                'Days Past Due': [0, 15]
-            })
             st.dataframe(sample_rentroll)
             
             st.markdown("**Sample Locks File (CSV or Excel):**")
-            sample_locks = pd.DataFrame({
-                'Unit Number': ['A001', 'A002', 'A003'],
-                'Status': ['Tenant Using Lock', 'Assigned Vacant', 'Assigned Overlock']
-            })
             st.dataframe(sample_locks)
             st.markdown("*Note: This file can be uploaded as either CSV or Excel (.xlsx) format*")
 